@@ -9,7 +9,7 @@ import logging
 import uuid
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
 from elisa_parser import ELISADatasheetParser
 from template_populator_enhanced import TemplatePopulator
@@ -18,6 +18,36 @@ from updated_template_populator import update_template_populator
 # Configure logging
 logger = logging.getLogger(__name__)
 
+def _process_one(template_path: Path,
+                 output_dir: Path,
+                 file_path: Path,
+                 output_filename: str = None,
+                 kit_name: str = None,
+                 catalog_number: str = None,
+                 lot_number: str = None) -> Tuple[bool, str, Path, Dict[str, Any]]:
+    """
+    Process a single file in a worker process.
+    
+    Defined at module level so it can be pickled by ProcessPoolExecutor.
+    
+    Args:
+        template_path: Path to the template to use
+        output_dir: Directory where the output file will be saved
+        file_path: Path to the ELISA datasheet to process
+        output_filename: Optional custom filename for the output
+        kit_name: Optional kit name to override extracted value
+        catalog_number: Optional catalog number to override extracted value
+        lot_number: Optional lot number to override extracted value
+        
+    Returns:
+        Tuple containing (success_status, error_message_if_any, output_path, progress_entries)
+    """
+    processor = BatchProcessor(template_path, output_dir)
+    success, error, output_path = processor.process_file(
+        file_path, output_filename, kit_name, catalog_number, lot_number
+    )
+    return success, error, output_path, processor.progress
+
 class BatchProcessor:
     """
     Processes multiple ELISA datasheets in batch, applying the same template to all.
@@ -35,7 +65,8 @@ class BatchProcessor:
         Args:
             template_path: Path to the template to use for all files
             output_dir: Directory where output files will be saved
-            max_workers: Maximum number of concurrent worker threads
+            max_workers: Maximum number of concurrent workers: threads in
+                process_batch_parallel, processes in process_batch with use_processes
         """
         self.template_path = template_path
         self.output_dir = output_dir
@@ -76,7 +107,7 @@ class BatchProcessor:
         }
         
         try:
-            logger.info(f"Processing file: {file_path}")
+            logger.info("Processing file: %s", file_path)
             self.progress[batch_id]['progress'] = 10
             
             # Generate output filename if not provided
@@ -127,7 +158,7 @@ class BatchProcessor:
                         from create_boster_template import create_boster_template
                         boster_template_path = create_boster_template()
                     
-                    logger.info(f"Switching to Boster template for document {file_path.name}")
+                    logger.info("Switching to Boster template for document %s", file_path.name)
                     template_to_use = boster_template_path
                 else:
                     template_to_use = self.template_path
@@ -156,13 +187,13 @@ class BatchProcessor:
                     # First, check for enhanced Red Dot template
                     enhanced_red_dot_template_path = Path("templates_docx/enhanced_red_dot_template.docx")
                     if enhanced_red_dot_template_path.exists():
-                        logger.info(f"Switching to enhanced Red Dot template for document {file_path.name}")
+                        logger.info("Switching to enhanced Red Dot template for document %s", file_path.name)
                         template_to_use = enhanced_red_dot_template_path
                     else:
                         # Fall back to standard Red Dot template
                         red_dot_template_path = Path("templates_docx/red_dot_template.docx")
                         if red_dot_template_path.exists():
-                            logger.info(f"Switching to Red Dot template for document {file_path.name}")
+                            logger.info("Switching to Red Dot template for document %s", file_path.name)
                             template_to_use = red_dot_template_path
                         else:
                             template_to_use = self.template_path
@@ -231,7 +262,7 @@ class BatchProcessor:
             self.progress[batch_id]['message'] = f'Successfully processed {file_path.name}'
             self.progress[batch_id]['output'] = str(output_path)
             
-            logger.info(f"Successfully processed {file_path} to {output_path}")
+            logger.info("Successfully processed %s to %s", file_path, output_path)
             return True, '', output_path
             
         except Exception as e:
@@ -248,9 +279,14 @@ class BatchProcessor:
                      output_filenames: List[str] = None,
                      kit_names: List[str] = None,
                      catalog_numbers: List[str] = None,
-                     lot_numbers: List[str] = None) -> Dict[str, Any]:
+                     lot_numbers: List[str] = None,
+                     use_processes: bool = False) -> Dict[str, Any]:
         """
-        Process a batch of files sequentially.
+        Process a batch of files sequentially, or in worker processes on request.
+        
+        Parsing and populating a document is CPU-bound Python/lxml work, so
+        with use_processes the files are spread over a process pool rather
+        than threads. Results keep the order of file_paths either way.
         
         Args:
             file_paths: List of paths to ELISA datasheets to process
@@ -258,6 +294,8 @@ class BatchProcessor:
             kit_names: Optional list of kit names to override extracted values
             catalog_numbers: Optional list of catalog numbers
             lot_numbers: Optional list of lot numbers
+            use_processes: Process the files in a pool of up to max_workers
+                processes instead of one after another in this process
             
         Returns:
             Dictionary with results of the batch processing
@@ -279,15 +317,47 @@ class BatchProcessor:
         if not lot_numbers:
             lot_numbers = [None] * len(file_paths)
             
-        # Process each file
+        # Process each file, in a process pool when asked to and there is more than one
+        outcomes = {}
+        if use_processes and len(file_paths) > 1:
+            max_workers = min(self.max_workers, os.cpu_count() or 1, len(file_paths))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                future_to_index = {
+                    executor.submit(
+                        _process_one,
+                        self.template_path,
+                        self.output_dir,
+                        file_path,
+                        output_filenames[i] if i < len(output_filenames) else None,
+                        kit_names[i] if i < len(kit_names) else None,
+                        catalog_numbers[i] if i < len(catalog_numbers) else None,
+                        lot_numbers[i] if i < len(lot_numbers) else None
+                    ): i
+                    for i, file_path in enumerate(file_paths)
+                }
+                
+                for future in as_completed(future_to_index):
+                    i = future_to_index[future]
+                    try:
+                        success, error, output_path, progress = future.result()
+                        self.progress.update(progress)
+                    except Exception as e:
+                        logger.exception(f"Error processing {file_paths[i]}: {e}")
+                        success, error, output_path = False, str(e), None
+                    outcomes[i] = (success, error, output_path)
+        else:
+            for i, file_path in enumerate(file_paths):
+                outcomes[i] = self.process_file(
+                    file_path,
+                    output_filenames[i] if i < len(output_filenames) else None,
+                    kit_names[i] if i < len(kit_names) else None,
+                    catalog_numbers[i] if i < len(catalog_numbers) else None,
+                    lot_numbers[i] if i < len(lot_numbers) else None
+                )
+        
+        # Collect results in submission order
         for i, file_path in enumerate(file_paths):
-            success, error, output_path = self.process_file(
-                file_path,
-                output_filenames[i] if i < len(output_filenames) else None,
-                kit_names[i] if i < len(kit_names) else None,
-                catalog_numbers[i] if i < len(catalog_numbers) else None,
-                lot_numbers[i] if i < len(lot_numbers) else None
-            )
+            success, error, output_path = outcomes[i]
             
             file_result = {
                 'file': str(file_path),
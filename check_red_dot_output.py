@@ -5,6 +5,8 @@ Check the structure of the Innovative Research output document.
 
 import logging
 from docx import Document
+from docx.oxml.ns import nsmap, qn
+from lxml import etree
 from pathlib import Path
 
 # Configure logging
@@ -12,6 +14,27 @@ logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Text-bearing children of a paragraph's runs (direct or inside hyperlinks), in
+# document order; together with RUN_CHILD_TEXT this matches what para.text reports.
+# Compiled with its own namespace map so it also works on elements parsed
+# without python-docx
+PARAGRAPH_TEXT_XPATH = etree.XPath(
+    "(w:r | w:hyperlink/w:r)/*[self::w:t or self::w:tab or self::w:ptab or self::w:noBreakHyphen"
+    " or self::w:cr or self::w:br[not(@w:type) or @w:type='textWrapping']]",
+    namespaces={'w': nsmap['w']}
+)
+RUN_CHILD_TEXT = {
+    qn('w:tab'): "\t",
+    qn('w:ptab'): "\t",
+    qn('w:noBreakHyphen'): "-",
+    qn('w:cr'): "\n",
+    qn('w:br'): "\n",
+}
+
+def paragraph_text(p):
+    """Return the text of a <w:p> element from one XPath query over its run contents"""
+    return "".join(RUN_CHILD_TEXT.get(node.tag) or node.text or "" for node in PARAGRAPH_TEXT_XPATH(p))
+
 def check_document_structure(document_path="red_dot_output.docx"):
     """
     Check the structure of the document and print a detailed layout of sections,
@@ -30,17 +53,24 @@ def check_document_structure(document_path="red_dot_output.docx"):
         
         logger.info(f"=== Document Structure of {document_path} ===")
         
+        # Read the paragraph list once, and every body paragraph's text straight
+        # from its <w:t> nodes, instead of going through para.text repeatedly
+        paras = doc.paragraphs
+        texts = [paragraph_text(p) for p in doc.element.body.xpath('./w:p')]
+        all_text = "\n".join(texts)
+        
         # Check document title
-        if len(doc.paragraphs) > 0:
-            title = doc.paragraphs[0].text
+        if len(texts) > 0:
+            title = texts[0]
             logger.info(f"Document Title: {title}")
         
-        # Check for correct company name
+        # Check for correct company name, only visiting paragraphs when the text contains it
         incorrect_name_count = 0
-        for para in doc.paragraphs:
-            if "Reddot Biotech" in para.text:
-                incorrect_name_count += 1
-                logger.warning(f"Found incorrect company name in paragraph: '{para.text[:50]}...'")
+        if "Reddot Biotech" in all_text:
+            for text in texts:
+                if "Reddot Biotech" in text:
+                    incorrect_name_count += 1
+                    logger.warning(f"Found incorrect company name in paragraph: '{text[:50]}...'")
                 
         if incorrect_name_count > 0:
             logger.warning(f"Found {incorrect_name_count} instances of incorrect company name 'Reddot Biotech'")
@@ -49,21 +79,21 @@ def check_document_structure(document_path="red_dot_output.docx"):
             
         # Find all section headings
         sections = []
-        for i, para in enumerate(doc.paragraphs):
-            # If paragraph has a style that starts with 'Heading' or contains uppercase text that could be a heading
-            if (para.style.name.startswith('Heading') or 
-                (para.text.isupper() and len(para.text.strip()) > 0 and len(para.text.strip()) < 50)):
-                sections.append((i, para.text))
-                logger.info(f"Section at P{i}: {para.text}")
+        for i, text in enumerate(texts):
+            # If paragraph contains uppercase text that could be a heading or has a style that starts with 'Heading'
+            if ((text.isupper() and len(text.strip()) > 0 and len(text.strip()) < 50) or
+                    paras[i].style.name.startswith('Heading')):
+                sections.append((i, text))
+                logger.info(f"Section at P{i}: {text}")
                 
                 # Check next paragraph for placeholders
-                if i + 1 < len(doc.paragraphs):
-                    next_para = doc.paragraphs[i + 1]
-                    if "{{" in next_para.text and "}}" in next_para.text:
-                        logger.warning(f"  - Found unprocessed placeholder: {next_para.text}")
+                if i + 1 < len(texts):
+                    next_text = texts[i + 1]
+                    if "{{" in next_text and "}}" in next_text:
+                        logger.warning(f"  - Found unprocessed placeholder: {next_text}")
                     else:
                         # Show a snippet of the next paragraph
-                        content = next_para.text[:50] + "..." if len(next_para.text) > 50 else next_para.text
+                        content = next_text[:50] + "..." if len(next_text) > 50 else next_text
                         if content.strip():
                             logger.info(f"  - Content starts with: {content}")
                             
@@ -11,9 +11,9 @@ import logging
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.shared import Pt, RGBColor, Inches
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.shared import Pt, Inches
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
 from pathlib import Path
 import shutil
 
@@ -21,6 +21,15 @@ import shutil
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Run properties for section headings: the blue (0, 70, 180) heading colour
+HEADING_RPR_XML = f'<w:rPr {nsdecls("w")}><w:color w:val="0046B4"/></w:rPr>'
+
+def add_section_heading(doc, text):
+    """Add a blue Heading 2 section title, giving its run its properties in one insert."""
+    heading = doc.add_paragraph(text, style='Heading 2')
+    heading.runs[0]._r.insert(0, parse_xml(HEADING_RPR_XML))
+    return heading
+
 def create_updated_template():
     """
     Create an updated template with proper table formats.
@@ -64,9 +73,7 @@ def create_updated_template():
     cat_lot.alignment = WD_ALIGN_PARAGRAPH.CENTER
     
     # Add intended use section
-    intended_use_title = doc.add_paragraph("INTENDED USE")
-    intended_use_title.style = 'Heading 2'
-    intended_use_title.runs[0].font.color.rgb = RGBColor(0, 70, 180)
+    intended_use_title = add_section_heading(doc, "INTENDED USE")
     
     intended_use_text = doc.add_paragraph("{{ intended_use|default('') }}")
     
@@ -74,9 +81,7 @@ def create_updated_template():
     doc.add_page_break()
     
     # Add Technical Details section
-    tech_details_title = doc.add_paragraph("TECHNICAL DETAILS")
-    tech_details_title.style = 'Heading 2'
-    tech_details_title.runs[0].font.color.rgb = RGBColor(0, 70, 180)
+    tech_details_title = add_section_heading(doc, "TECHNICAL DETAILS")
     
     # Add technical details table
     tech_table = doc.add_table(rows=4, cols=2)
@@ -98,9 +103,7 @@ def create_updated_template():
         cell.text = f"{{{{ technical_details_table[{i}].value|default('') }}}}"
     
     # Add overview section
-    overview_title = doc.add_paragraph("OVERVIEW")
-    overview_title.style = 'Heading 2'
-    overview_title.runs[0].font.color.rgb = RGBColor(0, 70, 180)
+    overview_title = add_section_heading(doc, "OVERVIEW")
     
     # Add overview table
     overview_table = doc.add_table(rows=8, cols=2)
@@ -123,16 +126,12 @@ def create_updated_template():
         cell.text = f"{{{{ overview_specifications_table[{i}].value|default('') }}}}"
     
     # Add background section
-    background_title = doc.add_paragraph("BACKGROUND")
-    background_title.style = 'Heading 2'
-    background_title.runs[0].font.color.rgb = RGBColor(0, 70, 180)
+    background_title = add_section_heading(doc, "BACKGROUND")
     
     background_text = doc.add_paragraph("{{ background_text|default('') }}")
     
     # Add kit components section
-    components_title = doc.add_paragraph("KIT COMPONENTS")
-    components_title.style = 'Heading 2'
-    components_title.runs[0].font.color.rgb = RGBColor(0, 70, 180)
+    components_title = add_section_heading(doc, "KIT COMPONENTS")
     
     # Add kit components table
     components_table = doc.add_table(rows=8, cols=4)
@@ -156,31 +155,23 @@ def create_updated_template():
             cell.text = f"{{{{ reagent_{i}_{field}|default('') }}}}"
     
     # Add required materials section
-    materials_title = doc.add_paragraph("MATERIALS REQUIRED BUT NOT PROVIDED")
-    materials_title.style = 'Heading 2'
-    materials_title.runs[0].font.color.rgb = RGBColor(0, 70, 180)
+    materials_title = add_section_heading(doc, "MATERIALS REQUIRED BUT NOT PROVIDED")
     
     # Add placeholder for materials
     materials_para = doc.add_paragraph("{{ required_materials_with_bullets|default('') }}")
     
     # Add reagent preparation section
-    reagent_title = doc.add_paragraph("REAGENT PREPARATION")
-    reagent_title.style = 'Heading 2'
-    reagent_title.runs[0].font.color.rgb = RGBColor(0, 70, 180)
+    reagent_title = add_section_heading(doc, "REAGENT PREPARATION")
     
     reagent_text = doc.add_paragraph("{{ reagent_preparation|default('') }}")
     
     # Add standard dilution section
-    dilution_title = doc.add_paragraph("DILUTION OF STANDARD")
-    dilution_title.style = 'Heading 2'
-    dilution_title.runs[0].font.color.rgb = RGBColor(0, 70, 180)
+    dilution_title = add_section_heading(doc, "DILUTION OF STANDARD")
     
     dilution_text = doc.add_paragraph("{{ dilution_of_standard|default('') }}")
     
     # Add preparations before assay section
-    prep_title = doc.add_paragraph("PREPARATIONS BEFORE ASSAY")
-    prep_title.style = 'Heading 2'
-    prep_title.runs[0].font.color.rgb = RGBColor(0, 70, 180)
+    prep_title = add_section_heading(doc, "PREPARATIONS BEFORE ASSAY")
     
     # Add numbered steps for preparations
     for i in range(1, 6):
@@ -196,17 +187,13 @@ def create_updated_template():
             prep_text = doc.add_paragraph("5. Don't reuse tips and tubes to avoid cross-contamination. Avoid using reagents from different batches.")
     
     # Add assay protocol section
-    protocol_title = doc.add_paragraph("ASSAY PROTOCOL")
-    protocol_title.style = 'Heading 2'
-    protocol_title.runs[0].font.color.rgb = RGBColor(0, 70, 180)
+    protocol_title = add_section_heading(doc, "ASSAY PROTOCOL")
     
     # Add numbered steps for protocol
     protocol_text = doc.add_paragraph("{{ assay_protocol_numbered|default('') }}")
     
     # Add standard curve section
-    curve_title = doc.add_paragraph("TYPICAL DATA / STANDARD CURVE")
-    curve_title.style = 'Heading 2'
-    curve_title.runs[0].font.color.rgb = RGBColor(0, 70, 180)
+    curve_title = add_section_heading(doc, "TYPICAL DATA / STANDARD CURVE")
     
     # Add curve description
     curve_desc = doc.add_paragraph("This standard curve is for demonstration only. A standard curve must be run with each assay.")
@@ -242,9 +229,7 @@ def create_updated_template():
             paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
     
     # Add variability section
-    var_title = doc.add_paragraph("INTRA/INTER-ASSAY VARIABILITY")
-    var_title.style = 'Heading 2'
-    var_title.runs[0].font.color.rgb = RGBColor(0, 70, 180)
+    var_title = add_section_heading(doc, "INTRA/INTER-ASSAY VARIABILITY")
     
     # Add intra-assay description
     intra_desc = doc.add_paragraph("Three samples of known concentration were tested on one plate to assess intra-assay precision.")
@@ -322,9 +307,7 @@ def create_updated_template():
                 paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
     
     # Add reproducibility section
-    reprod_title = doc.add_paragraph("REPRODUCIBILITY")
-    reprod_title.style = 'Heading 2'
-    reprod_title.runs[0].font.color.rgb = RGBColor(0, 70, 180)
+    reprod_title = add_section_heading(doc, "REPRODUCIBILITY")
     
     # Add description paragraph
     reprod_desc = doc.add_paragraph("Samples were tested in four different assay lots to assess reproducibility.")
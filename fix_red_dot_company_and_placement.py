@@ -18,27 +18,18 @@ logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def fix_company_names(document_path):
+def fix_company_names_inplace(doc):
     """
     Replace all instances of 'Reddot Biotech INC.' with 'Innovative Research, Inc.'
-    and 'Reddot Biotech' with 'Innovative Research' in the document.
+    and 'Reddot Biotech' with 'Innovative Research' in a loaded document.
     
     Args:
-        document_path: Path to the document to modify
+        doc: The Document object to modify
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Create a backup of the document
-        document_path = Path(document_path)
-        backup_path = document_path.with_name(f"{document_path.stem}_before_name_changes{document_path.suffix}")
-        shutil.copy2(document_path, backup_path)
-        logger.info(f"Created backup at {backup_path}")
-        
-        # Load the document
-        doc = Document(document_path)
-        
         # Define replacements
         replacements = [
             ('Reddot Biotech INC.', 'Innovative Research, Inc.'),
@@ -76,8 +67,6 @@ def fix_company_names(document_path):
                             para.text = modified_text
                             table_count += 1
         
-        # Save the document
-        doc.save(document_path)
         logger.info(f"Replaced company names in {para_count} paragraphs and {table_count} table cells")
         return True
         
@@ -85,9 +74,10 @@ def fix_company_names(document_path):
         logger.error(f"Error fixing company names: {e}")
         return False
 
-def fix_table_position(document_path):
+def fix_company_names(document_path):
     """
-    Fix the position of the REAGENTS PROVIDED table in the document.
+    Replace all instances of 'Reddot Biotech INC.' with 'Innovative Research, Inc.'
+    and 'Reddot Biotech' with 'Innovative Research' in the document.
     
     Args:
         document_path: Path to the document to modify
@@ -98,13 +88,35 @@ def fix_table_position(document_path):
     try:
         # Create a backup of the document
         document_path = Path(document_path)
-        backup_path = document_path.with_name(f"{document_path.stem}_before_table_fix{document_path.suffix}")
+        backup_path = document_path.with_name(f"{document_path.stem}_before_name_changes{document_path.suffix}")
         shutil.copy2(document_path, backup_path)
         logger.info(f"Created backup at {backup_path}")
         
         # Load the document
         doc = Document(document_path)
         
+        if not fix_company_names_inplace(doc):
+            return False
+        
+        # Save the document
+        doc.save(document_path)
+        return True
+        
+    except Exception as e:
+        logger.error(f"Error fixing company names: {e}")
+        return False
+
+def fix_table_position_inplace(doc):
+    """
+    Fix the position of the REAGENTS PROVIDED table in a loaded document.
+    
+    Args:
+        doc: The Document object to modify
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
         # Find the REAGENTS PROVIDED section
         reagents_section_idx = None
         for i, para in enumerate(doc.paragraphs):
@@ -118,11 +130,12 @@ def fix_table_position(document_path):
             return False
         
         # Find the next section after REAGENTS PROVIDED
+        paragraphs = doc.paragraphs
         next_section_idx = None
-        for i in range(reagents_section_idx + 1, len(doc.paragraphs)):
-            if doc.paragraphs[i].style.name.startswith('Heading'):
+        for i in range(reagents_section_idx + 1, len(paragraphs)):
+            if paragraphs[i].style.name.startswith('Heading'):
                 next_section_idx = i
-                logger.info(f"Found next section at paragraph {i}: '{doc.paragraphs[i].text}'")
+                logger.info(f"Found next section at paragraph {i}: '{paragraphs[i].text}'")
                 break
         
         # Find tables in the document
@@ -159,18 +172,15 @@ def fix_table_position(document_path):
         
         # If the next paragraph is empty or just whitespace, use it
         # Otherwise, add a new paragraph
-        if target_idx < len(doc.paragraphs) and not doc.paragraphs[target_idx].text.strip():
-            target_para = doc.paragraphs[target_idx]
+        paragraphs = doc.paragraphs
+        if target_idx < len(paragraphs) and not paragraphs[target_idx].text.strip():
+            target_para = paragraphs[target_idx]
             target_para.text = ""
         else:
             # Insert a new paragraph after the REAGENTS PROVIDED heading
-            p_element = doc.paragraphs[reagents_section_idx]._element
+            p_element = paragraphs[reagents_section_idx]._element
             new_p = p_element.__class__()
             p_element.addnext(new_p)
-            
-            # Refresh the paragraphs list after adding the new paragraph
-            doc = Document(document_path)
-            target_idx = reagents_section_idx + 1
         
         # Add the table at the target position
         table = doc.add_table(rows=len(table_data), cols=len(table_data[0]))
@@ -189,21 +199,51 @@ def fix_table_position(document_path):
                 for run in paragraph.runs:
                     run.bold = True
         
+        logger.info("Successfully moved table to the correct position")
+        return True
+        
+    except Exception as e:
+        logger.error(f"Error fixing table position: {e}")
+        return False
+
+def fix_table_position(document_path):
+    """
+    Fix the position of the REAGENTS PROVIDED table in the document.
+    
+    Args:
+        document_path: Path to the document to modify
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        # Create a backup of the document
+        document_path = Path(document_path)
+        backup_path = document_path.with_name(f"{document_path.stem}_before_table_fix{document_path.suffix}")
+        shutil.copy2(document_path, backup_path)
+        logger.info(f"Created backup at {backup_path}")
+        
+        # Load the document
+        doc = Document(document_path)
+        
+        if not fix_table_position_inplace(doc):
+            return False
+        
         # Save the modified document
         doc.save(document_path)
-        logger.info(f"Successfully moved table to the correct position in: {document_path}")
+        logger.info(f"Saved table position fix to: {document_path}")
         return True
         
     except Exception as e:
         logger.error(f"Error fixing table position: {e}")
         return False
 
-def fix_document(document_path):
+def fix_document_inplace(doc):
     """
-    Apply all fixes to the document.
+    Apply all fixes to a loaded document without saving it.
     
     Args:
-        document_path: Path to the document to modify
+        doc: The Document object to modify
         
     Returns:
         True if successful, False otherwise
@@ -211,17 +251,43 @@ def fix_document(document_path):
     success = True
     
     # First fix company names
-    if not fix_company_names(document_path):
+    if not fix_company_names_inplace(doc):
         logger.warning("Failed to fix company names")
         success = False
     
     # Then fix table position
-    if not fix_table_position(document_path):
+    if not fix_table_position_inplace(doc):
         logger.warning("Failed to fix table position")
         success = False
     
     return success
 
+def fix_document(document_path):
+    """
+    Apply all fixes to the document, loading and saving it once.
+    
+    Args:
+        document_path: Path to the document to modify
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        # Create a backup of the document
+        document_path = Path(document_path)
+        backup_path = document_path.with_name(f"{document_path.stem}_before_name_changes{document_path.suffix}")
+        shutil.copy2(document_path, backup_path)
+        logger.info(f"Created backup at {backup_path}")
+        
+        doc = Document(document_path)
+        success = fix_document_inplace(doc)
+        doc.save(document_path)
+        return success
+        
+    except Exception as e:
+        logger.error(f"Error fixing document: {e}")
+        return False
+
 def process_output_document(document_path):
     """
     Process the output document after template population to fix common issues.
@@ -25,6 +25,9 @@ logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Section headings whose paragraph index fix_red_dot_format needs
+SECTIONS_TO_FIND = frozenset({"INTENDED USE", "ASSAY PROCEDURE"})
+
 def fix_red_dot_format(document_path):
     """
     Apply comprehensive formatting fixes to Red Dot documents.
@@ -64,27 +67,27 @@ def fix_red_dot_format(document_path):
             logger.info(f"Created Calibri Body style with 1.15 line spacing")
         
         # Find the sections
-        intended_use_idx = None
-        assay_procedure_idx = None
         assay_procedure_content = None
+        section_indices = {}
         
         # Track all headings for moving INTENDED USE
         headings = []
         
-        # Find all sections
+        # Find all sections, reading each paragraph's text once
         for i, para in enumerate(doc.paragraphs):
+            text = para.text.strip()
+            
             # Mark any heading
-            if para.style.name.startswith('Heading') or para.text.strip().isupper():
-                headings.append((i, para.text.strip()))
+            if para.style.name.startswith('Heading') or text.isupper():
+                headings.append((i, text))
                 
                 # Look for specific sections
-                if para.text.strip() == "INTENDED USE":
-                    intended_use_idx = i
-                    logger.info(f"Found INTENDED USE section at paragraph {i}")
-                    
-                elif para.text.strip() == "ASSAY PROCEDURE":
-                    assay_procedure_idx = i
-                    logger.info(f"Found ASSAY PROCEDURE section at paragraph {i}")
+                if text in SECTIONS_TO_FIND:
+                    section_indices[text] = i
+                    logger.info(f"Found {text} section at paragraph {i}")
+        
+        intended_use_idx = section_indices.get("INTENDED USE")
+        assay_procedure_idx = section_indices.get("ASSAY PROCEDURE")
                     
         # If we found INTENDED USE, move it to the first page
         if intended_use_idx:
@@ -13,21 +13,30 @@ from docx import Document
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from docx.shared import Pt, RGBColor, Cm
 from docx.enum.table import WD_ALIGN_VERTICAL, WD_TABLE_ALIGNMENT
+from docx.oxml.ns import nsmap
+from docx.text.paragraph import Paragraph
+from lxml.etree import XPath
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Body paragraphs whose text contains $keyword in any (ASCII) case; compiled once
+# so the scan runs inside libxml2 rather than over doc.paragraphs
+_SECTION_XPATH = XPath(
+    './w:p[contains(translate(., "abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ"), $keyword)]',
+    namespaces={'w': nsmap['w']}
+)
+
+def find_section(doc, keyword):
+    """Return the first body paragraph whose text contains the upper-case keyword, or None."""
+    candidates = (Paragraph(p, doc._body) for p in _SECTION_XPATH(doc.element.body, keyword=keyword))
+    return next((para for para in candidates if keyword in para.text.upper()), None)
+
 def add_kit_components_table(doc):
     """Add a kit components table to the document."""
     # Find the KIT COMPONENTS section
-    kit_components_idx = None
-    for i, para in enumerate(doc.paragraphs):
-        if "KIT COMPONENTS" in para.text.upper():
-            kit_components_idx = i
-            break
-    
-    if kit_components_idx is None:
+    if find_section(doc, "KIT COMPONENTS") is None:
         logger.warning("KIT COMPONENTS section not found")
         return
     
@@ -53,10 +62,11 @@ def add_kit_components_table(doc):
     
     # Add reagent placeholders rows
     for i in range(1, 12):
-        table.rows[i].cells[0].text = f"{{{{ reagent_{i}_name }}}}"
-        table.rows[i].cells[1].text = f"{{{{ reagent_{i}_quantity }}}}"
-        table.rows[i].cells[2].text = f"{{{{ reagent_{i}_volume }}}}"
-        table.rows[i].cells[3].text = f"{{{{ reagent_{i}_storage }}}}"
+        cells = table.rows[i].cells
+        cells[0].text = f"{{{{ reagent_{i}_name }}}}"
+        cells[1].text = f"{{{{ reagent_{i}_quantity }}}}"
+        cells[2].text = f"{{{{ reagent_{i}_volume }}}}"
+        cells[3].text = f"{{{{ reagent_{i}_storage }}}}"
     
     # Set column widths
     table.columns[0].width = Cm(5.0)  # Description
@@ -69,13 +79,7 @@ def add_kit_components_table(doc):
 def add_technical_details_table(doc):
     """Add a technical details table to the document."""
     # Find the TECHNICAL DETAILS section
-    technical_idx = None
-    for i, para in enumerate(doc.paragraphs):
-        if "TECHNICAL DETAILS" in para.text.upper():
-            technical_idx = i
-            break
-    
-    if technical_idx is None:
+    if find_section(doc, "TECHNICAL DETAILS") is None:
         logger.warning("TECHNICAL DETAILS section not found")
         return
     
@@ -96,12 +100,13 @@ def add_technical_details_table(doc):
     ]
     
     for i, prop in enumerate(properties):
-        table.rows[i].cells[0].text = prop
+        cells = table.rows[i].cells
+        cells[0].text = prop
         # Use safer access with default fallback if index doesn't exist
-        table.rows[i].cells[1].text = "{{ technical_details_table[" + str(i) + "].value if technical_details_table and " + str(i) + " < technical_details_table|length else 'N/A' }}"
+        cells[1].text = "{{ technical_details_table[" + str(i) + "].value if technical_details_table and " + str(i) + " < technical_details_table|length else 'N/A' }}"
         
         # Make property names bold
-        for paragraph in table.rows[i].cells[0].paragraphs:
+        for paragraph in cells[0].paragraphs:
             for run in paragraph.runs:
                 run.bold = True
     
@@ -114,13 +119,7 @@ def add_technical_details_table(doc):
 def fix_variability_tables(doc):
     """Fix the variability tables in the document."""
     # Find the INTRA/INTER-ASSAY VARIABILITY section
-    variability_idx = None
-    for i, para in enumerate(doc.paragraphs):
-        if "INTRA/INTER-ASSAY VARIABILITY" in para.text.upper():
-            variability_idx = i
-            break
-    
-    if variability_idx is None:
+    if find_section(doc, "INTRA/INTER-ASSAY VARIABILITY") is None:
         logger.warning("VARIABILITY section not found")
         return
     
@@ -146,10 +145,11 @@ def fix_variability_tables(doc):
     
     # Add sample rows
     for i in range(1, 4):
-        intra_table.rows[i].cells[0].text = f"Sample {i}"
-        intra_table.rows[i].cells[1].text = "{{ variability.intra_assay.sample_" + str(i) + ".n if variability and variability.intra_assay else 'N/A' }}"
-        intra_table.rows[i].cells[2].text = "{{ variability.intra_assay.sample_" + str(i) + ".mean if variability and variability.intra_assay else 'N/A' }}"
-        intra_table.rows[i].cells[3].text = "{{ variability.intra_assay.sample_" + str(i) + ".sd if variability and variability.intra_assay else 'N/A' }}"
+        cells = intra_table.rows[i].cells
+        cells[0].text = f"Sample {i}"
+        cells[1].text = "{{ variability.intra_assay.sample_" + str(i) + ".n if variability and variability.intra_assay else 'N/A' }}"
+        cells[2].text = "{{ variability.intra_assay.sample_" + str(i) + ".mean if variability and variability.intra_assay else 'N/A' }}"
+        cells[3].text = "{{ variability.intra_assay.sample_" + str(i) + ".sd if variability and variability.intra_assay else 'N/A' }}"
     
     # Add a paragraph with inter-assay text
     para = doc.add_paragraph("Three samples of known concentration were tested in separate assays to assess inter-assay precision.")
@@ -173,23 +173,18 @@ def fix_variability_tables(doc):
     
     # Add sample rows
     for i in range(1, 4):
-        inter_table.rows[i].cells[0].text = f"Sample {i}"
-        inter_table.rows[i].cells[1].text = "{{ variability.inter_assay.sample_" + str(i) + ".n if variability and variability.inter_assay else 'N/A' }}"
-        inter_table.rows[i].cells[2].text = "{{ variability.inter_assay.sample_" + str(i) + ".mean if variability and variability.inter_assay else 'N/A' }}"
-        inter_table.rows[i].cells[3].text = "{{ variability.inter_assay.sample_" + str(i) + ".sd if variability and variability.inter_assay else 'N/A' }}"
+        cells = inter_table.rows[i].cells
+        cells[0].text = f"Sample {i}"
+        cells[1].text = "{{ variability.inter_assay.sample_" + str(i) + ".n if variability and variability.inter_assay else 'N/A' }}"
+        cells[2].text = "{{ variability.inter_assay.sample_" + str(i) + ".mean if variability and variability.inter_assay else 'N/A' }}"
+        cells[3].text = "{{ variability.inter_assay.sample_" + str(i) + ".sd if variability and variability.inter_assay else 'N/A' }}"
     
     return intra_table, inter_table
 
 def fix_reproducibility_table(doc):
     """Fix the reproducibility table in the document."""
     # Find the REPRODUCIBILITY section
-    reproducibility_idx = None
-    for i, para in enumerate(doc.paragraphs):
-        if "REPRODUCIBILITY" in para.text.upper():
-            reproducibility_idx = i
-            break
-    
-    if reproducibility_idx is None:
+    if find_section(doc, "REPRODUCIBILITY") is None:
         logger.warning("REPRODUCIBILITY section not found")
         return
     
@@ -220,25 +215,24 @@ def fix_reproducibility_table(doc):
     for i in range(1, 4):
         idx = i - 1  # 0-indexed for template access
         # Use safe indexing with defaults
-        repro_table.rows[i].cells[0].text = "{{ reproducibility[" + str(idx) + "].sample if reproducibility and " + str(idx) + " < reproducibility|length else 'Sample " + str(i) + "' }}"
-        repro_table.rows[i].cells[1].text = "{{ reproducibility[" + str(idx) + "].lot1 if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
-        repro_table.rows[i].cells[2].text = "{{ reproducibility[" + str(idx) + "].lot2 if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
-        repro_table.rows[i].cells[3].text = "{{ reproducibility[" + str(idx) + "].lot3 if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
-        repro_table.rows[i].cells[4].text = "{{ reproducibility[" + str(idx) + "].lot4 if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
-        repro_table.rows[i].cells[5].text = "{{ reproducibility[" + str(idx) + "].sd if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
-        repro_table.rows[i].cells[6].text = "{{ reproducibility[" + str(idx) + "].cv if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
+        cells = repro_table.rows[i].cells
+        cells[0].text = "{{ reproducibility[" + str(idx) + "].sample if reproducibility and " + str(idx) + " < reproducibility|length else 'Sample " + str(i) + "' }}"
+        cells[1].text = "{{ reproducibility[" + str(idx) + "].lot1 if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
+        cells[2].text = "{{ reproducibility[" + str(idx) + "].lot2 if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
+        cells[3].text = "{{ reproducibility[" + str(idx) + "].lot3 if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
+        cells[4].text = "{{ reproducibility[" + str(idx) + "].lot4 if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
+        cells[5].text = "{{ reproducibility[" + str(idx) + "].sd if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
+        cells[6].text = "{{ reproducibility[" + str(idx) + "].cv if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
     
     return repro_table
 
-def fix_all_tables():
-    """Fix all tables in the enhanced template."""
-    # Load the enhanced template
-    template_path = Path('templates_docx/enhanced_template_complete.docx')
-    output_path = Path('templates_docx/enhanced_template_fixed.docx')
+def apply_table_fixes(doc):
+    """
+    Add or fix all tables in a loaded enhanced template.
     
-    doc = Document(template_path)
-    
-    # Add or fix tables
+    Args:
+        doc: The Document object to modify
+    """
     kit_table = add_kit_components_table(doc)
     if kit_table:
         logger.info("Added kit components table")
@@ -255,6 +249,15 @@ def fix_all_tables():
     repro_table = fix_reproducibility_table(doc)
     if repro_table:
         logger.info("Fixed reproducibility table")
+
+def fix_all_tables():
+    """Fix all tables in the enhanced template."""
+    # Load the enhanced template
+    template_path = Path('templates_docx/enhanced_template_complete.docx')
+    output_path = Path('templates_docx/enhanced_template_fixed.docx')
+    
+    doc = Document(template_path)
+    apply_table_fixes(doc)
     
     # Save the updated template
     doc.save(output_path)
@@ -6,7 +6,9 @@ This module populates the Innovative Research template with data extracted from
 It maps extracted ELISA kit data to the Innovative Research template format.
 """
 
+import hashlib
 import logging
+import pickle
 import re
 import os
 from pathlib import Path
@@ -14,6 +16,7 @@ from typing import Dict, Any, List, Tuple, Optional
 from docxtpl import DocxTemplate
 
 import docx
+import elisa_parser
 from elisa_parser import extract_elisa_data, ELISADatasheetParser
 
 # Configure logging
@@ -281,6 +284,46 @@ def extract_red_dot_data(source_path: Path) -> Dict[str, Any]:
     return data
 
 
+def cached_extract_red_dot_data(source_path: Path, cache_dir: Path = Path(".cache")) -> Dict[str, Any]:
+    """
+    Extract Innovative Research data, reusing a pickled result for unchanged input.
+    
+    The cache key is the SHA-256 of the source document together with the
+    modification times of the extraction modules, so editing the parser or this
+    module invalidates earlier results.
+    
+    Args:
+        source_path: Path to the source Innovative Research ELISA kit datasheet
+        cache_dir: Directory holding the pickled extraction results
+        
+    Returns:
+        Dictionary containing structured data extracted from the datasheet
+    """
+    source_path = Path(source_path)
+    digest = hashlib.sha256(source_path.read_bytes())
+    for module_file in (__file__, elisa_parser.__file__):
+        digest.update(str(os.stat(module_file).st_mtime_ns).encode())
+    cache_path = Path(cache_dir) / f"{digest.hexdigest()}.pkl"
+    
+    try:
+        data = pickle.loads(cache_path.read_bytes())
+        logger.info(f"Using cached extraction for {source_path.name}")
+        return data
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        # Missing, truncated or stale entries (e.g. pickled classes that have since
+        # moved or changed) are simply extracted again
+        pass
+    
+    data = extract_red_dot_data(source_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a per-process temporary file and move it into place, so concurrent
+    # workers never read or produce a half-written entry
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(tmp_path, cache_path)
+    return data
+
+
 def populate_red_dot_template(
     source_path: Path, 
     template_path: Path, 
@@ -6,23 +6,406 @@ Enhanced version of the template populator to handle the new technical details t
 
 import re
 import logging
+import functools
+from copy import deepcopy
+from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+from weakref import WeakKeyDictionary
 
 import docx
 from docx import Document
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-from docx.shared import Pt, RGBColor, Length
+from docx.shared import Pt, Length
+from docx.text.paragraph import Paragraph
 from docx.enum.text import WD_LINE_SPACING
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn, nsdecls
+from lxml import etree
 
 from docxtpl import DocxTemplate
 
+from utils import load_template_bytes
+
+# Formatting values shared by the post-processing steps
+_PT_36 = Pt(36)
+_LINE_MULT = WD_LINE_SPACING.MULTIPLE
+
+# Styles that carry the document font and line spacing; body runs inherit from them
+_CALIBRI_STYLE_NAMES = ('Normal', 'Heading 1', 'Heading 2', 'Heading 3', 'List Bullet', 'List Number')
+
+# Translation table that deletes registered, trademark and copyright symbols
+_TM_TABLE = str.maketrans('', '', '®™©')
+
+# Patterns to remove for all text processing
+_PATTERNS_TO_REMOVE = (
+    r'For more information on.*?\.', 
+    r'For additional information.*?\.', 
+    r'Visit (?:our|the) (?:website|resource center).*?\.', 
+    r'Please refer to (?:our|the) (?:website|resource center).*?\.', 
+    r'More details can be found at.*?\.', 
+    r'Technical support (?:is|can be) available.*?\.', 
+    r'Visit.*?\.(?:com|org|net).*?\.', 
+    r'.*?resource center at.*?\.',
+    r'.*?ELISA Resource Center.*?\.',
+    r'.*?technical resource center.*?\.',
+    r'For more information on assay principle, protocols, and troubleshooting tips, see.*',
+    r'Publications Citing This Product.*?publications\.',
+    r'\d+ Publications Citing This Product.*',
+    r'PubMed ID:.*?hydrocephalus',
+    r'.*html to see all \d+ publications\.',
+    r'Mouse KLK1/Kallikrein 1 ELISA Kit.*?publications'
+)
+_PATTERNS_TO_REMOVE_RES = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in _PATTERNS_TO_REMOVE)
+
+# Keys that _clean_data always adds, seeded up front so the processed dict is
+# sized for them in one allocation. Conditionally added keys are left out on
+# purpose: a None placeholder would otherwise render as "None" in the template.
+_ADDED_KEYS_SENTINELS = {
+    'variability': None,
+    'reproducibility': None,
+}
+
+def _clean_text(value: str) -> str:
+    """
+    Replace company names and strip trademarks, promotional text and
+    external references from a single text value.
+    
+    Args:
+        value: Raw text value
+        
+    Returns:
+        Cleaned text value
+    """
+    # Replace "Boster" with "Innovative Research"
+    value = re.sub(r'\bBoster\b', 'Innovative Research', value)
+    value = re.sub(r'\bBOSTER\b', 'INNOVATIVE RESEARCH', value)
+    value = re.sub(r'\bboster\b', 'innovative research', value)
+
+    # Remove all trademark and registered trademark symbols
+    value = value.translate(_TM_TABLE)
+
+    # Remove all variations of PicoKine®
+    value = re.sub(r'PicoKine\s*®', '', value)
+    value = re.sub(r'Picokine\s*®', '', value)
+    value = re.sub(r'PicoKine', '', value)
+    value = re.sub(r'Picokine', '', value)
+
+    # Remove references to online tools and Biocompare product reviews
+    value = re.sub(r'offers an easy-to-use online ELISA data analysis tool\. Try it out at.*?\.com.*?online', '', value)
+    value = re.sub(r'Submit a (?:product )?review (?:of this product )?to Biocompare\.com.*?contribution\.', '', value, flags=re.IGNORECASE | re.DOTALL)
+    value = re.sub(r'Submit a (?:product )?review (?:of this product )?to Biocompare.*?gift card.*', '', value, flags=re.IGNORECASE | re.DOTALL)
+    value = re.sub(r'.*?receive a \$[0-9]+ Amazon\.com gift card.*', '', value, flags=re.IGNORECASE | re.DOTALL)
+
+    # Remove references to resource centers and external URLs
+    for pattern in _PATTERNS_TO_REMOVE_RES:
+        value = pattern.sub('', value)
+
+    # Final cleanup
+    value = re.sub(r'\s+', ' ', value)  # Replace multiple spaces with single space
+    value = value.strip()
+
+    return value
+
+# Text that marks the start of a new section: a TECHNICAL/OVERVIEW title or an
+# all-caps paragraph (no lowercase letters and at least one uppercase letter)
+_SECTION_HEADING_RE = re.compile(r'TECHNICAL|OVERVIEW|^[^a-z]*[A-Z][^a-z]*$')
+
+# Overview table header matchers, checked in order; the first match wins
+_OVERVIEW_FIELD_MATCHERS = (
+    (re.compile(r'product|name'), 'product_name'),
+    (re.compile(r'reactive|species|detect'), 'reactive_species'),
+    (re.compile(r'sensitivity'), 'sensitivity'),
+    (re.compile(r'detection|range'), 'detection_range'),
+    (re.compile(r'(?=.*sample)(?=.*type)', re.DOTALL), 'sample_type'),
+    (re.compile(r'(?=.*sample)(?=.*volume)', re.DOTALL), 'sample_volume'),
+    (re.compile(r'(?=.*assay)(?=.*type)', re.DOTALL), 'assay_type'),
+    (re.compile(r'protocol|time|duration'), 'protocol_time'),
+    (re.compile(r'storage'), 'storage'),
+)
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_header(text: str) -> str:
+    """
+    Lowercase and strip cell or paragraph text for keyword matching.
+    
+    Headers repeat across tables and across documents converted in one
+    process, so results are memoised by the raw text.
+    
+    Args:
+        text: Raw cell or paragraph text
+        
+    Returns:
+        The lowercased, stripped text
+    """
+    return text.strip().lower()
+
+@functools.lru_cache(maxsize=256)
+def _classify_header(header: str) -> Optional[str]:
+    """
+    Map a normalized overview table row header to the field it describes.
+    
+    Args:
+        header: Lowercased, stripped header cell text
+        
+    Returns:
+        The field id of the first matching overview field, or None
+    """
+    for pattern, field in _OVERVIEW_FIELD_MATCHERS:
+        if pattern.search(header):
+            return field
+    return None
+
+# Technical details header keywords mapped to the processed_data key they fill.
+# Dict order is the priority order used when a header contains several keywords.
+_TECH_FIELD_KEYWORDS = {
+    'sensitivity': 'sensitivity',
+    'range': 'detection_range',
+    'specificity': 'specificity',
+    'standard': 'standard',
+    'antibod': 'standard',
+    'cross-reactivity': 'cross_reactivity',
+    'cross reactivity': 'cross_reactivity',
+}
+_TECH_FIELD_PRIORITY = {field: i for i, field in enumerate(dict.fromkeys(_TECH_FIELD_KEYWORDS.values()))}
+_TECH_FIELD_RE = re.compile('|'.join(re.escape(k) for k in _TECH_FIELD_KEYWORDS))
+
+@functools.lru_cache(maxsize=256)
+def _classify_tech_header(header: str) -> Optional[str]:
+    """
+    Map a normalized technical details row header to the processed_data key it fills.
+    
+    Args:
+        header: Lowercased, stripped header cell text
+        
+    Returns:
+        The highest priority matching key, or None
+    """
+    fields = [_TECH_FIELD_KEYWORDS[m.group()] for m in _TECH_FIELD_RE.finditer(header)]
+    return min(fields, key=_TECH_FIELD_PRIORITY.__getitem__) if fields else None
+
+# Number of leading paragraphs searched for the intended use section
+_INTENDED_USE_SCAN_LIMIT = 10
+
+@dataclass
+class SectionIndex:
+    """
+    Paragraph positions of the sections the post-processing steps look for,
+    collected in a single pass over the document.
+    """
+    kit_components: Optional[int] = None
+    technical_details: Optional[int] = None
+    overview: Optional[int] = None
+    intended_use: Optional[int] = None
+    last_heading_is_data_analysis: bool = False
+
+def _set_cell_text_fast(tc, text: str) -> None:
+    """
+    Replace the content of a table cell's first paragraph with a single run.
+    
+    Equivalent to cell.paragraphs[0].clear() followed by add_run(text), but
+    works on the <w:tc> element directly instead of going through the
+    python-docx proxy objects. Paragraph properties are kept, and tabs and
+    line breaks in text become <w:tab/> and <w:br/> as they would there.
+    
+    Args:
+        tc: The <w:tc> element of the cell
+        text: Text to place in the cell
+    """
+    p = tc.find(qn('w:p'))
+    if p is None:
+        p = etree.SubElement(tc, qn('w:p'))
+    for child in list(p):
+        if child.tag != qn('w:pPr'):
+            p.remove(child)
+    r = etree.SubElement(p, qn('w:r'))
+    if '\t' in text or '\n' in text or '\r' in text:
+        # Let python-docx split tabs and line breaks into <w:tab/> and <w:br/>
+        r.text = text
+        return
+    t = etree.SubElement(r, qn('w:t'))
+    t.text = text
+    if text != text.strip():
+        t.set(qn('xml:space'), 'preserve')
+
+def _set_cell_text_if_different(tc, text: str) -> bool:
+    """
+    Replace a cell's first paragraph text only when it differs from the current text.
+    
+    Leaves the cell XML untouched when the existing text already matches
+    (ignoring surrounding whitespace).
+    
+    Args:
+        tc: The <w:tc> element of the cell
+        text: Text to place in the cell
+        
+    Returns:
+        True if the cell was rewritten, False if it already held the text
+    """
+    p = tc.find(qn('w:p'))
+    if p is not None and ''.join(t.text or '' for t in p.iter(qn('w:t'))).strip() == text.strip():
+        return False
+    _set_cell_text_fast(tc, text)
+    return True
+
+# Disclaimer heading (blue, all caps, bold) and text (Calibri 11pt) appended to every document
+_DISCLAIMER_XML = (
+    '<w:body {nsdecls}>'
+    '<w:p><w:pPr><w:pStyle w:val="{heading_style_id}"/></w:pPr>'
+    '<w:r><w:rPr><w:b/><w:caps/><w:color w:val="0046B4"/></w:rPr><w:t>DISCLAIMER</w:t></w:r></w:p>'
+    '<w:p><w:r><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/><w:sz w:val="22"/></w:rPr>'
+    "<w:t>This material is sold for in-vitro use only in manufacturing and research. "
+    "This material is not suitable for human use. It is the responsibility of the user to undertake "
+    "sufficient verification and testing to determine the suitability of each product's application. "
+    "The statements herein are offered for informational purposes only and are intended to be used "
+    "solely for your consideration, investigation and verification.</w:t></w:r></w:p>"
+    '</w:body>'
+)
+
+def _ensure_line_spacing(paragraph_format) -> None:
+    """
+    Set 1.15 multiple line spacing unless the paragraph already has it.
+    
+    Args:
+        paragraph_format: The python-docx ParagraphFormat to update
+    """
+    if paragraph_format.line_spacing != 1.15 or paragraph_format.line_spacing_rule != _LINE_MULT:
+        paragraph_format.line_spacing = 1.15
+        paragraph_format.line_spacing_rule = _LINE_MULT
+
+# Standard reproducibility table rows (sample, n, mean, SD, CV and
+# sample, four lots, mean, CV), shared by every populated document
+_INTRA_ASSAY_DATA = (
+    ("Sample 1", "16", "4.6%", "10.15", "7.0%"),
+    ("Sample 2", "16", "5.1%", "11.23", "7.5%"),
+    ("Sample 3", "16", "4.8%", "9.88", "6.7%"),
+)
+_INTER_ASSAY_DATA = (
+    ("Sample 1", "24", "7.8%", "13.05", "9.0%"),
+    ("Sample 2", "24", "8.2%", "14.27", "9.6%"),
+    ("Sample 3", "24", "8.4%", "12.69", "8.8%"),
+)
+_LOT_DATA = (
+    ("Sample 1", "150", "154", "170", "150", "156", "5.2%"),
+    ("Sample 2", "602", "649", "645", "637", "633", "2.9%"),
+    ("Sample 3", "1476", "1672", "1722", "1744", "1654", "7.2%"),
+)
+_PRECISION_ROWS_NEEDED = 1 + len(_INTRA_ASSAY_DATA)
+_PRECISION_COLS_NEEDED = 5
+_LOT_ROWS_NEEDED = 1 + len(_LOT_DATA)
+_LOT_COLS_NEEDED = 7
+
+def _table_rows_match(table, data: Sequence[Sequence[str]]) -> bool:
+    """
+    Check whether the rows after a table's header already hold the given data.
+    
+    Args:
+        table: The python-docx Table to check
+        data: Expected cell texts for the rows following the header row
+        
+    Returns:
+        True if every data row already matches, in which case nothing needs writing
+    """
+    rows = table.rows
+    if len(rows) <= len(data):
+        return False
+    current = tuple(
+        tuple(cell.text for cell in rows[i + 1].cells[:len(expected)])
+        for i, expected in enumerate(data)
+    )
+    return current == data
+
+# Row markup that makes <w:tc> order differ from python-docx's cell grid
+_MERGE_PATHS = tuple('.//' + qn(tag) for tag in ('w:gridSpan', 'w:vMerge', 'w:gridBefore'))
+
+def _write_fixed_rows(table, data: Sequence[Sequence[str]]) -> bool:
+    """
+    Write fixed data into the rows after a table's header without building row or cell proxies.
+    
+    Only used when the target rows are plain grids: each has at least as
+    many <w:tc> elements as its data row and no merged or offset cells, so the n-th
+    <w:tc> is the n-th cell python-docx would report.
+    
+    Args:
+        table: The python-docx Table to fill
+        data: Cell texts for the rows following the header row
+        
+    Returns:
+        True if the data was written, False if the table needs the general path
+    """
+    trs = table._tbl.findall(qn('w:tr'))[1:len(data) + 1]
+    if len(trs) < len(data):
+        return False
+    tc_tag = qn('w:tc')
+    rows_tcs = []
+    for tr, row_data in zip(trs, data):
+        tcs = tr.findall(tc_tag)
+        if len(tcs) < len(row_data) or any(tr.find(path) is not None for path in _MERGE_PATHS):
+            return False
+        rows_tcs.append(tcs)
+    for tcs, row_data in zip(rows_tcs, data):
+        for tc, text in zip(tcs, row_data):
+            _set_cell_text_fast(tc, text)
+    return True
+
+# Empty cell copied whenever a table has to grow; its width is set from the table grid
+_TC_TEMPLATE = parse_xml(f'<w:tc {nsdecls("w")}><w:tcPr><w:tcW w:w="0" w:type="dxa"/></w:tcPr><w:p/></w:tc>')
+# Row markup that makes a row's cells span or merge grid columns
+_SPAN_PATHS = tuple('.//' + qn(tag) for tag in ('w:gridSpan', 'w:vMerge'))
+
+def _new_tc(width: int):
+    """Return an empty <w:tc> of the given width in twentieths of a point."""
+    tc = deepcopy(_TC_TEMPLATE)
+    tc.find(qn('w:tcPr')).find(qn('w:tcW')).set(qn('w:w'), str(width))
+    return tc
+
+def _ensure_table_shape(table, nrows: int, ncols: int) -> None:
+    """
+    Grow a table to at least nrows rows spanning ncols grid columns by appending empty cells in place.
+    
+    Works on the <w:tbl> element directly so the table is not re-read
+    after every added row or cell. Rows are measured in grid columns
+    (gridBefore plus each cell's gridSpan); rows with spanned or vertically
+    merged cells are left alone. The table grid is widened first when it
+    has fewer than ncols columns, and new cells take their widths from it.
+    
+    Args:
+        table: The python-docx Table to grow
+        nrows: Minimum number of rows, including the header row
+        ncols: Minimum number of grid columns in each row
+    """
+    tbl = table._tbl
+    grid = tbl.tblGrid
+    grid_cols = grid.findall(qn('w:gridCol'))
+    if grid_cols and len(grid_cols) < ncols:
+        last_width = grid_cols[-1].get(qn('w:w'), '0')
+        for _ in range(ncols - len(grid_cols)):
+            etree.SubElement(grid, qn('w:gridCol')).set(qn('w:w'), last_width)
+    widths = [int(col.get(qn('w:w'), 0)) for col in grid.findall(qn('w:gridCol'))]
+    widths += [0] * (ncols - len(widths))
+    
+    trs = tbl.findall(qn('w:tr'))
+    for tr in trs:
+        if any(tr.find(path) is not None for path in _SPAN_PATHS):
+            continue
+        used = tr.grid_before + len(tr.tc_lst)
+        for k in range(used, ncols):
+            tr.append(_new_tc(widths[k]))
+    for _ in range(nrows - len(trs)):
+        tr = etree.SubElement(tbl, qn('w:tr'))
+        for k in range(ncols):
+            tr.append(_new_tc(widths[k]))
+
 class TemplatePopulator:
     """
     Populates DOCX templates with extracted ELISA datasheet data.
     
     Uses the docxtpl library to fill templates with the structured data
     extracted from ELISA kit datasheets.
+    
+    Instances can be reused across multiple populate() calls: the template file
+    is read from disk once and each render starts from a fresh copy of it.
     """
     
     def __init__(self, template_path: Path):
@@ -33,8 +416,35 @@ class TemplatePopulator:
             template_path: Path to the DOCX template file
         """
         self.template_path = template_path
-        self.template = DocxTemplate(template_path)
+        template_path = Path(template_path)
+        self._template_bytes = load_template_bytes(str(template_path), template_path.stat().st_mtime)
+        # Built from the cached bytes by each populate() call
+        self.template = None
         self.logger = logging.getLogger(__name__)
+        # Header signatures keyed by <w:tbl> element, see _table_header()
+        self._table_header_cache = WeakKeyDictionary()
+    
+    def _table_header(self, table) -> Tuple[int, Tuple[str, ...]]:
+        """
+        Get the column count and normalized header row text of a table.
+        
+        The result is cached per <w:tbl> element so repeated lookups while the
+        document is being post-processed don't walk the header cells again.
+        
+        Args:
+            table: The python-docx Table to inspect
+            
+        Returns:
+            Tuple of (column count, lowercased and stripped header cell texts)
+        """
+        tbl = table._tbl
+        signature = self._table_header_cache.get(tbl)
+        if signature is None:
+            rows = table.rows
+            header = tuple(_normalize_header(cell.text) for cell in rows[0].cells) if len(rows) else ()
+            signature = (len(table.columns), header)
+            self._table_header_cache[tbl] = signature
+        return signature
     
     def _clean_data(self, data: Dict[str, Any], kit_name: Optional[str] = None, 
                    catalog_number: Optional[str] = None, lot_number: Optional[str] = None) -> Dict[str, Any]:
@@ -51,7 +461,7 @@ class TemplatePopulator:
             Processed data dictionary ready for template population
         """
         # Start with a copy of the data to avoid modifying the original
-        processed_data = dict(data)
+        processed_data = {**_ADDED_KEYS_SENTINELS, **data}
         
         # Override with user-provided values if available
         if kit_name:
@@ -97,10 +507,7 @@ class TemplatePopulator:
                 processed_data['assay_protocol_steps'] = protocol
                 
                 # Also create a numbered version for text display
-                numbered_steps = []
-                for i, step in enumerate(protocol, 1):
-                    numbered_steps.append(f"{i}. {step}")
-                processed_data['assay_protocol_numbered'] = "\n".join(numbered_steps)
+                processed_data['assay_protocol_numbered'] = "\n".join(f"{i}. {step}" for i, step in enumerate(protocol, 1))
                 
         # Format standard curve data for table display - just use the original data
         if 'standard_curve_table' in processed_data and processed_data['standard_curve_table']:
@@ -119,9 +526,7 @@ class TemplatePopulator:
                     value = re.sub(r'\bboster\b', 'innovative research', value)
                     
                     # Remove all trademark and registered trademark symbols
-                    value = re.sub(r'®', '', value)
-                    value = re.sub(r'™', '', value)
-                    value = re.sub(r'©', '', value)
+                    value = value.translate(_TM_TABLE)
                     
                     # Clean up the value
                     value = value.strip()
@@ -183,11 +588,13 @@ class TemplatePopulator:
             if isinstance(prep_data, dict) and 'text' in prep_data and 'steps' in prep_data:
                 # Extract the non-step portions of the text
                 non_step_text = prep_data['text']
-                # Find all steps in the text
-                for step in prep_data['steps']:
-                    # Remove the numbered steps from the main text
-                    step_text = f"{step['number']}. {step['text']}"
-                    non_step_text = non_step_text.replace(step_text, "")
+                if prep_data['steps']:
+                    # Remove all the numbered steps from the main text in a single pass
+                    # (longest first so a step never shadows one that contains it)
+                    step_texts = sorted((f"{step['number']}. {step['text']}" for step in prep_data['steps']),
+                                        key=len, reverse=True)
+                    steps_pattern = re.compile('|'.join(re.escape(step_text) for step_text in step_texts))
+                    non_step_text = steps_pattern.sub('', non_step_text)
                 
                 # Clean up the non-step text by removing extra whitespace and empty lines
                 non_step_text_lines = [line.strip() for line in non_step_text.split('\n') if line.strip()]
@@ -207,11 +614,7 @@ class TemplatePopulator:
                         })
                     
                     # Create a numbered list for text display (but we'll use the actual step objects for rendering)
-                    numbered_steps = []
-                    for step in fixed_steps:
-                        numbered_steps.append(f"{step['number']}. {step['text']}")
-                    
-                    processed_data['preparations_numbered'] = "\n".join(numbered_steps)
+                    processed_data['preparations_numbered'] = "\n".join(f"{step['number']}. {step['text']}" for step in fixed_steps)
                     # Use the fixed and sorted steps for the template
                     processed_data['preparations_steps'] = fixed_steps
                 else:
@@ -224,29 +627,9 @@ class TemplatePopulator:
                 processed_data['preparations_numbered'] = prep_data
                 processed_data['preparations_steps'] = []
                 
-        # Define patterns to remove for all text processing
-        patterns_to_remove = [
-            r'For more information on.*?\.', 
-            r'For additional information.*?\.', 
-            r'Visit (?:our|the) (?:website|resource center).*?\.', 
-            r'Please refer to (?:our|the) (?:website|resource center).*?\.', 
-            r'More details can be found at.*?\.', 
-            r'Technical support (?:is|can be) available.*?\.', 
-            r'Visit.*?\.(?:com|org|net).*?\.', 
-            r'.*?resource center at.*?\.',
-            r'.*?ELISA Resource Center.*?\.',
-            r'.*?technical resource center.*?\.',
-            r'For more information on assay principle, protocols, and troubleshooting tips, see.*',
-            r'Publications Citing This Product.*?publications\.',
-            r'\d+ Publications Citing This Product.*',
-            r'PubMed ID:.*?hydrocephalus',
-            r'.*html to see all \d+ publications\.',
-            r'Mouse KLK1/Kallikrein 1 ELISA Kit.*?publications'
-        ]
-
         # Clean up data to remove unwanted content and replace company names
         for key, value in processed_data.items():
-            if isinstance(value, str):
+            if type(value) is str:
                 # Special handling for background text to remove publication citations
                 if key == 'background':
                     # Remove publication citations from background
@@ -259,66 +642,16 @@ class TemplatePopulator:
                     value = re.sub(r'.*html to see all \d+ publications\..*', '', value, flags=re.IGNORECASE | re.DOTALL)
                     value = re.sub(r'\d+ Publications Citing This Product.*', '', value, flags=re.IGNORECASE | re.DOTALL)
                 
-                # Replace "Boster" with "Innovative Research"
-                value = re.sub(r'\bBoster\b', 'Innovative Research', value)
-                value = re.sub(r'\bBOSTER\b', 'INNOVATIVE RESEARCH', value)
-                value = re.sub(r'\bboster\b', 'innovative research', value)
-                
-                # Remove all trademark and registered trademark symbols
-                value = re.sub(r'®', '', value)
-                value = re.sub(r'™', '', value)
-                value = re.sub(r'©', '', value)
-                
-                # Remove all variations of PicoKine®
-                value = re.sub(r'PicoKine\s*®', '', value)
-                value = re.sub(r'Picokine\s*®', '', value)
-                value = re.sub(r'PicoKine', '', value)
-                value = re.sub(r'Picokine', '', value)
-                
-                # Remove references to online tools and Biocompare product reviews
-                value = re.sub(r'offers an easy-to-use online ELISA data analysis tool\. Try it out at.*?\.com.*?online', '', value)
-                value = re.sub(r'Submit a (?:product )?review (?:of this product )?to Biocompare\.com.*?contribution\.', '', value, flags=re.IGNORECASE | re.DOTALL)
-                value = re.sub(r'Submit a (?:product )?review (?:of this product )?to Biocompare.*?gift card.*', '', value, flags=re.IGNORECASE | re.DOTALL)
-                value = re.sub(r'.*?receive a \$[0-9]+ Amazon\.com gift card.*', '', value, flags=re.IGNORECASE | re.DOTALL)
-                
-                # Remove references to resource centers and external URLs
-                for pattern in patterns_to_remove:
-                    value = re.sub(pattern, '', value, flags=re.IGNORECASE | re.DOTALL)
-                
-                # Final cleanup
-                value = re.sub(r'\s+', ' ', value)  # Replace multiple spaces with single space
-                value = value.strip()
-                
-                processed_data[key] = value
-            elif isinstance(value, list):
-                if all(isinstance(item, dict) for item in value):
+                processed_data[key] = _clean_text(value)
+            elif type(value) is list:
+                if all(type(item) is dict for item in value):
                     # Handle lists of dictionaries (like reagents, tables, etc.)
                     for item in value:
                         for item_key, item_value in item.items():
-                            if isinstance(item_value, str):
-                                # Apply the same replacements to dictionary values
-                                replaced_value = item_value
-                                replaced_value = re.sub(r'\bBoster\b', 'Innovative Research', replaced_value)
-                                replaced_value = re.sub(r'\bBOSTER\b', 'INNOVATIVE RESEARCH', replaced_value)
-                                replaced_value = re.sub(r'\bboster\b', 'innovative research', replaced_value)
-                                
-                                # Remove all trademark and registered trademark symbols
-                                replaced_value = re.sub(r'®', '', replaced_value)
-                                replaced_value = re.sub(r'™', '', replaced_value)
-                                replaced_value = re.sub(r'©', '', replaced_value)
-                                
-                                # Remove all variations of PicoKine®
-                                replaced_value = re.sub(r'PicoKine\s*®', '', replaced_value)
-                                replaced_value = re.sub(r'Picokine\s*®', '', replaced_value)
-                                replaced_value = re.sub(r'PicoKine', '', replaced_value)
-                                replaced_value = re.sub(r'Picokine', '', replaced_value)
-                                
-                                # Remove references to online tools
-                                replaced_value = re.sub(r'offers an easy-to-use online ELISA data analysis tool\. Try it out at.*?\.com.*?online', '', replaced_value)
-                                replaced_value = re.sub(r'Submit a (?:product )?review (?:of this product )?to Biocompare', '', replaced_value, flags=re.IGNORECASE)
-                                
-                                item[item_key] = replaced_value
-                elif all(isinstance(item, str) for item in value):
+                            if type(item_value) is str:
+                                # Apply the same cleanup as for plain string values
+                                item[item_key] = _clean_text(item_value)
+                elif all(type(item) is str for item in value):
                     # Handle lists of strings (like required_materials_list)
                     processed_list = []
                     for item in value:
@@ -454,14 +787,13 @@ class TemplatePopulator:
                 reagents = processed_data['reagents']
                 self.logger.info(f"Processing {len(reagents)} reagents for template")
                 
-                # Add individual reagent entries for up to 12 rows (increased from 7)
-                for i in range(min(len(reagents), 12)):
-                    reagent = reagents[i]
-                    # Fill in each column for this reagent
-                    processed_data[f'reagent_{i+1}_name'] = reagent.get('name', '')
-                    processed_data[f'reagent_{i+1}_quantity'] = reagent.get('quantity', '')
-                    processed_data[f'reagent_{i+1}_volume'] = reagent.get('volume', '')
-                    processed_data[f'reagent_{i+1}_storage'] = reagent.get('storage', '')
+                # Add individual reagent entries for up to 12 rows (increased from 7),
+                # filling in each column for every reagent in a single update
+                processed_data.update({
+                    f'reagent_{i+1}_{field}': reagent.get(field, '')
+                    for i, reagent in enumerate(reagents[:12])
+                    for field in ('name', 'quantity', 'volume', 'storage')
+                })
             
             # Process required materials for the template
             if 'required_materials' in processed_data:
@@ -470,14 +802,9 @@ class TemplatePopulator:
                 
                 # Format as a bulleted list for display in the template
                 if isinstance(materials, list):
-                    # Clean materials to avoid double bullet points
-                    cleaned_materials = []
-                    for item in materials:
-                        # Remove any existing bullet points or leading spaces
-                        item = item.strip()
-                        if item.startswith('•'):
-                            item = item[1:].strip()
-                        cleaned_materials.append(item)
+                    # Clean materials to avoid double bullet points by removing
+                    # any existing bullet points or leading spaces
+                    cleaned_materials = [item.strip().removeprefix('•').strip() for item in materials]
                     
                     # Join with bullet points
                     processed_data['required_materials_with_bullets'] = "• " + "\n• ".join(cleaned_materials)
@@ -497,13 +824,15 @@ class TemplatePopulator:
             # Process assay protocol steps for the template and individual step fields
             if 'assay_protocol' in processed_data:
                 protocol_steps = processed_data['assay_protocol']
-                # Add individual protocol step entries
-                for i in range(min(len(protocol_steps), 20)):
-                    processed_data[f'protocol_step_{i+1}'] = protocol_steps[i]
-                
-                # Clear any unused steps
-                for i in range(len(protocol_steps) + 1, 21):
-                    processed_data[f'protocol_step_{i}'] = ''
+                # Add individual protocol step entries, clearing any unused steps
+                processed_data.update({
+                    f'protocol_step_{i+1}': protocol_steps[i] if i < len(protocol_steps) else ''
+                    for i in range(20)
+                })
+            
+            # Start from a fresh copy of the cached template so repeated renders
+            # don't see state left behind by a previous populate() call
+            self.template = DocxTemplate(BytesIO(self._template_bytes))
             
             # Render the template with the context data
             self.template.render(processed_data)
@@ -514,21 +843,23 @@ class TemplatePopulator:
             # Load the document for post-processing
             doc = Document(output_path)
             
+            # Locate all the sections the post-processing steps need in one pass
+            sections = self._scan_sections(doc)
+            
             # Format the document header and first page
-            self._format_document_header(doc)
+            self._format_document_header(doc, sections)
             
             # Apply Calibri font and 1.15 line spacing to the entire document
             self._apply_document_formatting(doc)
             
             # Add disclaimer at the end of the document
-            self._add_disclaimer(doc)
+            self._add_disclaimer(doc, sections)
             
             # Save the formatted document
             doc.save(output_path)
             
             # Post-process the document to directly modify tables
-            self._post_process_kit_components(output_path, processed_data)
-            self._post_process_technical_tables(output_path, processed_data)
+            self._post_process_all(output_path, processed_data, sections)
             
             self.logger.info(f"Template successfully populated and saved to {output_path}")
             
@@ -536,7 +867,48 @@ class TemplatePopulator:
             self.logger.error(f"Error populating template: {e}")
             raise
             
-    def _format_document_header(self, doc):
+    def _scan_sections(self, doc) -> SectionIndex:
+        """
+        Find the paragraphs that mark the sections used during post-processing.
+        
+        Only paragraphs are appended after this scan (the disclaimer), so the
+        recorded indices stay valid for the rest of the post-processing.
+        
+        Args:
+            doc: The Document object to scan
+            
+        Returns:
+            SectionIndex with the position of each section that was found
+        """
+        sections = SectionIndex()
+        last_heading_text = None
+        
+        for i, para in enumerate(doc.paragraphs):
+            text = _normalize_header(para.text)
+            
+            # Intended use is only expected within the first few paragraphs; the
+            # cheap index check short-circuits the substring tests for the rest
+            if i < _INTENDED_USE_SCAN_LIMIT and sections.intended_use is None and (
+                    'intended use' in text or 'purpose' in text):
+                sections.intended_use = i
+            
+            if sections.kit_components is None and ("kit components" in text or "materials provided" in text):
+                self.logger.info(f"Found Kit Components section at paragraph {i}: {para.text}")
+                sections.kit_components = i
+            
+            if "technical details" in text:
+                sections.technical_details = i
+            elif "overview" in text:
+                sections.overview = i
+            
+            # The first paragraph is restyled as the title, so it never counts as a heading
+            if i > 0 and para.style.name.startswith('Heading'):
+                last_heading_text = text
+        
+        sections.last_heading_is_data_analysis = last_heading_text == "data analysis"
+        return sections
+    
+    def _format_document_header(self, doc, sections: SectionIndex):
         """
         Format the document header to be size 36pt with Title style.
         Also ensure the first page only contains title, catalog number, lot number, 
@@ -544,15 +916,19 @@ class TemplatePopulator:
         
         Args:
             doc: The Document object to modify
+            sections: Section positions found by _scan_sections
         """
+        # Snapshot the paragraph list once; python-docx rebuilds it on every access
+        paras = list(doc.paragraphs)
+        
         # Format the document title (first paragraph should be the title)
-        if len(doc.paragraphs) > 0:
-            title_para = doc.paragraphs[0]
+        if paras:
+            title_para = paras[0]
             
             # Set Title style properties directly
             if 'Title' in doc.styles:
                 title_style = doc.styles['Title']
-                title_style.font.size = Pt(36)
+                title_style.font.size = _PT_36
                 title_style.font.bold = True
                 title_style.font.name = 'Calibri'
                 title_style.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
@@ -562,7 +938,7 @@ class TemplatePopulator:
             
             # Also set font size directly on the runs for extra assurance
             for run in title_para.runs:
-                run.font.size = Pt(36)
+                run.font.size = _PT_36
                 run.font.bold = True
                 run.font.name = 'Calibri'
             
@@ -575,30 +951,25 @@ class TemplatePopulator:
                 title_text = title_para.text
                 title_para.clear()
                 new_run = title_para.add_run(title_text)
-                new_run.font.size = Pt(36)
+                new_run.font.size = _PT_36
                 new_run.font.bold = True
                 new_run.font.name = 'Calibri'
                 self.logger.info(f"Added new formatted run with text: {title_text}")
         
-        # Find the intended use section (should be within first few paragraphs)
-        intended_use_idx = None
-        for i, para in enumerate(doc.paragraphs[:10]):  # Check the first 10 paragraphs
-            if 'intended use' in para.text.lower() or 'purpose' in para.text.lower():
-                intended_use_idx = i
-                break
+        # The intended use section should be within the first few paragraphs
+        intended_use_idx = sections.intended_use
         
         # If found, add page break after the intended use section
         if intended_use_idx is not None:
             # Look for the end of the intended use section (usually a paragraph or two)
             # We'll look for the next section heading as the end marker
             end_idx = intended_use_idx
-            for i in range(intended_use_idx + 1, min(intended_use_idx + 5, len(doc.paragraphs))):
+            for i in range(intended_use_idx + 1, min(intended_use_idx + 5, len(paras))):
                 # Look for the next heading or all-caps paragraph 
                 # (common formatting for section headings)
-                if (doc.paragraphs[i].style.name.startswith('Heading') or 
-                    doc.paragraphs[i].text.isupper() or
-                    'TECHNICAL' in doc.paragraphs[i].text or
-                    'OVERVIEW' in doc.paragraphs[i].text):
+                # The precompiled text test runs first; the style lookup is the costlier check
+                para = paras[i]
+                if _SECTION_HEADING_RE.search(para.text) or para.style.name.startswith('Heading'):
                     # Found the next section, so put page break at previous paragraph
                     end_idx = i - 1
                     break
@@ -607,23 +978,23 @@ class TemplatePopulator:
                 end_idx = i
             
             # If there are runs in the paragraph
-            if len(doc.paragraphs[end_idx].runs) > 0:
+            if len(paras[end_idx].runs) > 0:
                 # Add page break after the intended use section
-                doc.paragraphs[end_idx].runs[-1].add_break(docx.enum.text.WD_BREAK.PAGE)
+                paras[end_idx].runs[-1].add_break(docx.enum.text.WD_BREAK.PAGE)
             else:
                 # No runs, add a run with page break
-                run = doc.paragraphs[end_idx].add_run()
+                run = paras[end_idx].add_run()
                 run.add_break(docx.enum.text.WD_BREAK.PAGE)
         else:
             # If intended use not found, just add page break after first few paragraphs
-            if len(doc.paragraphs) > 5:
-                if len(doc.paragraphs[3].runs) > 0:  # After intended use description (usually paragraph 3)
-                    doc.paragraphs[3].runs[-1].add_break(docx.enum.text.WD_BREAK.PAGE)
+            if len(paras) > 5:
+                if len(paras[3].runs) > 0:  # After intended use description (usually paragraph 3)
+                    paras[3].runs[-1].add_break(docx.enum.text.WD_BREAK.PAGE)
                 else:
-                    run = doc.paragraphs[3].add_run()
+                    run = paras[3].add_run()
                     run.add_break(docx.enum.text.WD_BREAK.PAGE)
 
-    def _add_disclaimer(self, doc):
+    def _add_disclaimer(self, doc, sections: SectionIndex):
         """
         Add a disclaimer section at the end of the document.
         Place it directly after the DATA ANALYSIS section without a page break,
@@ -631,93 +1002,95 @@ class TemplatePopulator:
         
         Args:
             doc: The Document object to modify
+            sections: Section positions found by _scan_sections
         """
-        # Find if the last section is DATA ANALYSIS
-        is_after_data_analysis = False
-        
-        # Check the last heading in the document
-        for i in range(len(doc.paragraphs) - 1, -1, -1):
-            if doc.paragraphs[i].style.name.startswith('Heading'):
-                if doc.paragraphs[i].text.strip().upper() == "DATA ANALYSIS":
-                    is_after_data_analysis = True
-                break
+        # Only add a page break if the last section is not DATA ANALYSIS
+        if not sections.last_heading_is_data_analysis:
+            # Walk the body backwards to the last paragraph instead of listing them all
+            p_tag = qn('w:p')
+            last_p = next((el for el in reversed(doc.element.body) if el.tag == p_tag), None)
+            if last_p is not None:
+                last_para = Paragraph(last_p, doc._body)
+                if len(last_para.runs) > 0:
+                    last_para.runs[-1].add_break(docx.enum.text.WD_BREAK.PAGE)
+                else:
+                    run = last_para.add_run()
+                    run.add_break(docx.enum.text.WD_BREAK.PAGE)
         
-        # Only add a page break if not following the DATA ANALYSIS section
-        if not is_after_data_analysis and len(doc.paragraphs) > 0:
-            last_para = doc.paragraphs[-1]
-            if len(last_para.runs) > 0:
-                last_para.runs[-1].add_break(docx.enum.text.WD_BREAK.PAGE)
+        # Add the blue all-caps DISCLAIMER heading and the Calibri 11pt text in one
+        # fragment, placed where add_paragraph would put them (before the section properties)
+        heading_style_id = doc.styles['Heading 2'].style_id
+        fragment = parse_xml(_DISCLAIMER_XML.format(nsdecls=nsdecls('w'), heading_style_id=heading_style_id))
+        body = doc.element.body
+        sect_pr = body.sectPr
+        for p in list(fragment):
+            if sect_pr is not None:
+                sect_pr.addprevious(p)
             else:
-                run = last_para.add_run()
-                run.add_break(docx.enum.text.WD_BREAK.PAGE)
-        
-        # Add DISCLAIMER heading
-        disclaimer_heading = doc.add_paragraph("DISCLAIMER")
-        disclaimer_heading.style = 'Heading 2'
-        
-        # Set heading to blue color with all caps (RGB 0,70,180)
-        for run in disclaimer_heading.runs:
-            run.font.color.rgb = RGBColor(0, 70, 180)
-            run.font.all_caps = True
-            run.font.bold = True
-        
-        # Add disclaimer text
-        disclaimer_text = doc.add_paragraph()
-        disclaimer_text.add_run("This material is sold for in-vitro use only in manufacturing and research. This material is not suitable for human use. It is the responsibility of the user to undertake sufficient verification and testing to determine the suitability of each product's application. The statements herein are offered for informational purposes only and are intended to be used solely for your consideration, investigation and verification.")
-        
-        # Apply formatting to disclaimer text
-        for run in disclaimer_text.runs:
-            run.font.name = "Calibri"
-            run.font.size = Pt(11)
+                body.append(p)
         
         self.logger.info("Added disclaimer to the end of the document")
 
-    def _post_process_kit_components(self, output_path: Path, processed_data: Dict[str, Any]) -> None:
+    def _post_process_all(self, output_path: Path, processed_data: Dict[str, Any],
+                          sections: SectionIndex) -> None:
+        """
+        Run every table post-processing step on the populated template,
+        loading and saving the document only once.
+        
+        Args:
+            output_path: Path to the populated template file
+            processed_data: Dictionary containing the processed data used for template population
+            sections: Section positions found by _scan_sections
+        """
+        try:
+            # Load the document to modify tables directly
+            doc = Document(output_path)
+            
+            self._post_process_kit_components(doc, processed_data, sections)
+            self._post_process_technical_tables(doc, processed_data, sections)
+            
+            # Save the modified document
+            doc.save(output_path)
+            
+        except Exception as e:
+            self.logger.error(f"Error in post-processing tables: {e}")
+            # Continue anyway - this is just an enhancement
+    
+    def _post_process_kit_components(self, doc, processed_data: Dict[str, Any],
+                                     sections: SectionIndex) -> None:
         """
         Perform post-processing on the populated template to handle the kit components table.
         This directly modifies the DOCX after the Jinja2 template rendering is complete.
         
         Args:
-            output_path: Path to the populated template file
+            doc: The loaded Document object to modify
             processed_data: Dictionary containing the processed data used for template population
+            sections: Section positions found by _scan_sections
         """
         try:
             if 'reagents' not in processed_data:
                 self.logger.warning("No reagents data found for post-processing")
                 return
                 
-            # Load the document to modify tables directly
-            doc = Document(output_path)
-            
-            # Find the kit components section
-            kit_components_section_idx = None
-            for i, para in enumerate(doc.paragraphs):
-                text = para.text.strip().lower()
-                if "kit components" in text or "materials provided" in text:
-                    self.logger.info(f"Found Kit Components section at paragraph {i}: {para.text}")
-                    kit_components_section_idx = i
-                    break
-            
-            if kit_components_section_idx is None:
+            if sections.kit_components is None:
                 self.logger.warning("Kit Components section not found, cannot update table")
                 return
+                
+            tables = list(doc.tables)
             
             # Identify the correct kit components table
             kit_components_table_idx = None
             
             # First check if there's a 4-column table (preferred format)
-            for i, table in enumerate(doc.tables):
-                if len(table.columns) == 4:
+            for i, table in enumerate(tables):
+                col_count, header_row = self._table_header(table)
+                if col_count == 4:
                     # Check headers
-                    try:
-                        header_row = [cell.text.strip().lower() for cell in table.rows[0].cells]
-                        if len(header_row) == 4 and any(keyword in " ".join(header_row) for keyword in 
-                                                      ["description", "quantity", "volume", "storage"]):
-                            self.logger.info(f"Found 4-column kit components table at index {i}")
-                            kit_components_table_idx = i
-                            break
-                    except:
-                        pass
+                    if len(header_row) == 4 and any(keyword in " ".join(header_row) for keyword in 
+                                                  ["description", "quantity", "volume", "storage"]):
+                        self.logger.info(f"Found 4-column kit components table at index {i}")
+                        kit_components_table_idx = i
+                        break
             
             # If 4-column table not found, use the first table after the kit components section
             if kit_components_table_idx is None:
@@ -725,12 +1098,12 @@ class TemplatePopulator:
                 kit_components_table_idx = 2
                 self.logger.info(f"Using table at index {kit_components_table_idx} for kit components")
             
-            if kit_components_table_idx >= len(doc.tables):
+            if kit_components_table_idx >= len(tables):
                 self.logger.warning(f"Table index {kit_components_table_idx} is out of bounds")
                 return
                 
             # Get the kit components table
-            kit_table = doc.tables[kit_components_table_idx]
+            kit_table = tables[kit_components_table_idx]
             
             # Clear out existing content in kit components table (keep header row)
             for row_idx in range(1, len(kit_table.rows)):
@@ -763,8 +1136,6 @@ class TemplatePopulator:
                     if 'storage' in reagent:
                         kit_table.rows[row_idx].cells[3].text = reagent['storage']
             
-            # Save the modified document
-            doc.save(output_path)
             self.logger.info(f"Updated kit components table with {len(reagents)} reagents")
             
         except Exception as e:
@@ -778,82 +1149,79 @@ class TemplatePopulator:
         Args:
             doc: The Document object to modify
         """
-        # First set the default style
-        style = doc.styles['Normal']
-        style.font.name = "Calibri"
-        style.paragraph_format.line_spacing = 1.15
-        style.paragraph_format.line_spacing_rule = WD_LINE_SPACING.MULTIPLE
+        # Fetch the styles once; each doc.styles lookup walks the whole styles part
+        all_styles = {style.name: style for style in doc.styles}
+        
+        # Set the named styles first; runs without their own font inherit from them
+        for style_id in _CALIBRI_STYLE_NAMES:
+            if style_id in all_styles:
+                self._apply_calibri_style(all_styles[style_id])
+        
+        # Paragraph styles used in the body, so inherited fonts resolve to Calibri too
+        used_style_ids = set()
+        
+        def format_paragraphs(paragraphs):
+            for para in paragraphs:
+                # Apply paragraph formatting
+                _ensure_line_spacing(para.paragraph_format)
+                used_style_ids.add(para._p.style)
         
         # Apply to all paragraphs
-        for para in doc.paragraphs:
-            # Apply paragraph formatting
-            para.paragraph_format.line_spacing = 1.15
-            para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.MULTIPLE
-            
-            # Apply font to all runs
-            for run in para.runs:
-                run.font.name = "Calibri"
+        format_paragraphs(doc.paragraphs)
         
         # Apply to all tables
         for table in doc.tables:
             for row in table.rows:
                 for cell in row.cells:
-                    for para in cell.paragraphs:
-                        # Apply paragraph formatting
-                        para.paragraph_format.line_spacing = 1.15
-                        para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.MULTIPLE
-                        
-                        # Apply font to all runs
-                        for run in para.runs:
-                            run.font.name = "Calibri"
-                            
-        # Make one final pass for any styled paragraphs
-        for style_id in ['Heading 1', 'Heading 2', 'Heading 3', 'List Bullet', 'List Number']:
-            if style_id in doc.styles:
-                style = doc.styles[style_id]
+                    format_paragraphs(cell.paragraphs)
+        
+        # Only runs with a font override of their own need rewriting; find them all
+        # in one XPath query over the body rather than visiting every run
+        for rfonts in doc.element.body.xpath('.//w:p/w:r/w:rPr/w:rFonts[@w:ascii]'):
+            rfonts.set(qn('w:ascii'), "Calibri")
+            rfonts.set(qn('w:hAnsi'), "Calibri")
+        
+        # Give every other paragraph style in use the same font
+        used_style_ids.discard(None)
+        for style in all_styles.values():
+            if style.style_id in used_style_ids and style.name not in _CALIBRI_STYLE_NAMES:
                 style.font.name = "Calibri"
-                # Keep line spacing consistent
-                style.paragraph_format.line_spacing = 1.15
-                style.paragraph_format.line_spacing_rule = WD_LINE_SPACING.MULTIPLE
     
-    def _post_process_technical_tables(self, output_path: Path, processed_data: Dict[str, Any]) -> None:
+    @staticmethod
+    def _apply_calibri_style(style):
+        """
+        Set Calibri font and 1.15 line spacing on a style.
+        
+        Args:
+            style: The python-docx style to modify
+        """
+        style.font.name = "Calibri"
+        style.paragraph_format.line_spacing = 1.15
+        style.paragraph_format.line_spacing_rule = _LINE_MULT
+    
+    def _post_process_technical_tables(self, doc, processed_data: Dict[str, Any],
+                                       sections: SectionIndex) -> None:
         """
         Perform post-processing on the populated template to properly populate
         TECHNICAL DETAILS, OVERVIEW, and REPRODUCIBILITY tables that may be empty.
         
         Args:
-            output_path: Path to the populated template file
+            doc: The loaded Document object to modify
             processed_data: Dictionary containing the processed data used for template population
+            sections: Section positions found by _scan_sections
         """
         try:
-            # Load the document to modify tables directly
-            doc = Document(output_path)
-            
-            # Define section names to find
-            technical_details_section = None
-            overview_section = None
-            
-            # Find the technical details and overview sections
-            for i, para in enumerate(doc.paragraphs):
-                text = para.text.strip().upper()
-                if "TECHNICAL DETAILS" in text:
-                    technical_details_section = i
-                elif "OVERVIEW" in text:
-                    overview_section = i
-            
             # Process technical details table
-            if technical_details_section is not None:
+            if sections.technical_details is not None:
                 self._process_technical_details_table(doc, processed_data)
             
             # Process overview table
-            if overview_section is not None:
+            if sections.overview is not None:
                 self._process_overview_table(doc, processed_data)
             
             # Process reproducibility table
             self._process_reproducibility_table(doc, processed_data)
             
-            # Save the document
-            doc.save(output_path)
             self.logger.info("Updated technical details, overview, and reproducibility tables")
             
         except Exception as e:
@@ -872,46 +1240,22 @@ class TemplatePopulator:
         if doc.tables and len(doc.tables) > 0:
             table = doc.tables[0]  # Get the first table
             
-            # Make sure we have rows to process
-            if len(table.rows) >= 2:  # At least header + one row
+            # Make sure we have rows to process, each with a header and a value cell
+            col_count, _ = self._table_header(table)
+            if len(table.rows) >= 2 and col_count >= 2:  # At least header + one row
                 self.logger.info(f"Processing technical details table with {len(table.rows)} rows")
                 
                 # Fill in the technical details
                 for row in table.rows:
-                    if len(row.cells) >= 2:
-                        # Check row header and populate value
-                        header = row.cells[0].text.lower().strip()
-                        
-                        # Match known technical details
-                        if 'sensitivity' in header:
-                            sensitivity = processed_data.get('sensitivity', '')
-                            if sensitivity:
-                                row.cells[1].paragraphs[0].clear()
-                                row.cells[1].paragraphs[0].add_run(sensitivity)
-                        
-                        elif 'detection range' in header or 'range' in header:
-                            detection_range = processed_data.get('detection_range', '')
-                            if detection_range:
-                                row.cells[1].paragraphs[0].clear()
-                                row.cells[1].paragraphs[0].add_run(detection_range)
-                        
-                        elif 'specificity' in header:
-                            specificity = processed_data.get('specificity', '')
-                            if specificity:
-                                row.cells[1].paragraphs[0].clear()
-                                row.cells[1].paragraphs[0].add_run(specificity)
-                        
-                        elif 'standard' in header or 'antibod' in header:
-                            standard = processed_data.get('standard', '')
-                            if standard:
-                                row.cells[1].paragraphs[0].clear()
-                                row.cells[1].paragraphs[0].add_run(standard)
-                        
-                        elif 'cross-reactivity' in header or 'cross reactivity' in header:
-                            cross_reactivity = processed_data.get('cross_reactivity', '')
-                            if cross_reactivity:
-                                row.cells[1].paragraphs[0].clear()
-                                row.cells[1].paragraphs[0].add_run(cross_reactivity)
+                    # Check row header and populate value
+                    header = _normalize_header(row.cells[0].text)
+                    
+                    # Match known technical details
+                    field = _classify_tech_header(header)
+                    if field:
+                        value = processed_data.get(field, '')
+                        if value:
+                            _set_cell_text_if_different(row.cells[1]._tc, value)
                 
                 self.logger.info("Processed technical details table")
     
@@ -931,6 +1275,9 @@ class TemplatePopulator:
             if len(table.rows) >= 1:  # At least one row
                 self.logger.info(f"Processing overview table with {len(table.rows)} rows")
                 
+                # Rows need both a header and a value cell to be populated
+                col_count, _ = self._table_header(table)
+                
                 # This is the overview table, process it
                 overview_specs = processed_data.get('overview_specifications', [])
                 
@@ -938,30 +1285,32 @@ class TemplatePopulator:
                 if not overview_specs:
                     self.logger.info("No overview specifications found, populating with available data")
                 
-                # Try to populate with any available specifications first
+                # Try to populate with any available specifications first, noting
+                # the rows the fallback pass may fill: empty value cells, plus the
+                # product name and reactive species rows, which are always refreshed
                 specs_found = False
-                for row in table.rows:
-                    if len(row.cells) >= 2:
+                has_empty_cells = False
+                fallback_rows = []
+                if col_count >= 2:
+                    for row in table.rows:
+                        cells = row.cells
                         # Check row header and populate value
-                        header = row.cells[0].text.lower().strip()
+                        header = _normalize_header(cells[0].text)
                         
                         # Try to find a matching specification
-                        if overview_specs:
-                            for spec in overview_specs:
-                                if spec['property'].lower() in header:
-                                    row.cells[1].paragraphs[0].clear()
-                                    row.cells[1].paragraphs[0].add_run(spec['value'])
-                                    specs_found = True
-                                    break
-                
-                # Populate with fallback data for any remaining empty cells
-                # First, check for any empty cells that need to be filled with fallback data
-                has_empty_cells = False
-                for row in table.rows:
-                    if len(row.cells) >= 2 and not row.cells[1].text.strip():
-                        has_empty_cells = True
-                        break
+                        for spec in overview_specs:
+                            if spec['property'].lower() in header:
+                                _set_cell_text_if_different(cells[1]._tc, spec['value'])
+                                specs_found = True
+                                break
                         
+                        if not cells[1].text.strip():
+                            has_empty_cells = True
+                            fallback_rows.append((cells[1], header))
+                        elif header in ('product name', 'reactive species'):
+                            fallback_rows.append((cells[1], header))
+                
+                # Populate with fallback data only when some cell is still empty
                 if has_empty_cells:
                     self.logger.info("Found empty cells in overview table, filling with fallback data")
                     
@@ -986,63 +1335,31 @@ class TemplatePopulator:
                     sample_type = processed_data.get('sample_type', 
                                                     'Cell culture media, serum, plasma, and other biological fluids')
                     
-                    # Fill in the overview table with extracted and fallback data
-                    for row in table.rows:
-                        if len(row.cells) >= 2:
-                            header = row.cells[0].text.lower().strip()
-                            value = row.cells[1].text.strip()
-                            
-                            # Only populate empty cells or update specific fields
-                            if not value or header.lower() in ['product name', 'reactive species']:
-                                # Fill in standard fields
-                                if 'product' in header or 'name' in header:
-                                    row.cells[1].paragraphs[0].clear()
-                                    row.cells[1].paragraphs[0].add_run(kit_name)
-                                
-                                elif 'reactive' in header or 'species' in header or 'detect' in header:
-                                    row.cells[1].paragraphs[0].clear()
-                                    cross_reactivity = processed_data.get('cross_reactivity', '')
-                                    if cross_reactivity:
-                                        if species == 'Mouse':
-                                            row.cells[1].paragraphs[0].add_run(f"This kit is for the detection of {species} Klk1. {cross_reactivity}")
-                                        else:
-                                            row.cells[1].paragraphs[0].add_run(f"This kit is for the detection of {species} KLK1/Kallikrein 1. {cross_reactivity}")
-                                    else:
-                                        if species == 'Mouse':
-                                            row.cells[1].paragraphs[0].add_run(f"This kit is for the detection of {species} Klk1. No significant cross-reactivity or interference with other analogs was observed.")
-                                        else:
-                                            row.cells[1].paragraphs[0].add_run(f"This kit is for the detection of {species} KLK1/Kallikrein 1. No significant cross-reactivity or interference with other analogs was observed.")
-                                
-                                elif 'sensitivity' in header and not value:
-                                    row.cells[1].paragraphs[0].clear()
-                                    row.cells[1].paragraphs[0].add_run(sensitivity)
-                                
-                                elif ('detection' in header or 'range' in header) and not value:
-                                    row.cells[1].paragraphs[0].clear()
-                                    row.cells[1].paragraphs[0].add_run(detection_range)
-                                    
-                                elif 'sample' in header and 'type' in header and not value:
-                                    row.cells[1].paragraphs[0].clear()
-                                    row.cells[1].paragraphs[0].add_run(sample_type)
-                                    
-                                elif ('sample' in header and 'volume' in header) and not value:
-                                    row.cells[1].paragraphs[0].clear()
-                                    row.cells[1].paragraphs[0].add_run("100 μl")
-                                    
-                                elif ('assay' in header and 'type' in header) and not value:
-                                    row.cells[1].paragraphs[0].clear()
-                                    row.cells[1].paragraphs[0].add_run("Sandwich ELISA")
-                                    
-                                elif (('protocol' in header or 'time' in header or 'duration' in header) and 
-                                     not value):
-                                    row.cells[1].paragraphs[0].clear()
-                                    row.cells[1].paragraphs[0].add_run("4.5 hours")
-                                    
-                                elif 'storage' in header and not value:
-                                    row.cells[1].paragraphs[0].clear()
-                                    row.cells[1].paragraphs[0].add_run("Store at 4°C for up to 6 months. For longer storage, keep at -20°C.")
-                                    
-                                    
+                    # Built once; every reactive species row gets the same sentence
+                    target = 'Klk1' if species == 'Mouse' else 'KLK1/Kallikrein 1'
+                    cross_reactivity = (processed_data.get('cross_reactivity', '')
+                                        or "No significant cross-reactivity or interference with other analogs was observed.")
+                    detection_sentence = f"This kit is for the detection of {species} {target}. {cross_reactivity}"
+                    
+                    # Value producers for each field id returned by _classify_header
+                    overview_handlers = {
+                        'product_name': lambda: kit_name,
+                        'reactive_species': lambda: detection_sentence,
+                        'sensitivity': lambda: sensitivity,
+                        'detection_range': lambda: detection_range,
+                        'sample_type': lambda: sample_type,
+                        'sample_volume': lambda: "100 μl",
+                        'assay_type': lambda: "Sandwich ELISA",
+                        'protocol_time': lambda: "4.5 hours",
+                        'storage': lambda: "Store at 4°C for up to 6 months. For longer storage, keep at -20°C.",
+                    }
+                    
+                    # Fill in the collected rows with extracted and fallback data
+                    for value_cell, header in fallback_rows:
+                        field = _classify_header(header)
+                        if field is not None:
+                            _set_cell_text_if_different(value_cell._tc, overview_handlers[field]())
+                
                 self.logger.info("Processed overview table")
     
     def _process_reproducibility_table(self, doc, processed_data: Dict[str, Any]) -> None:
@@ -1080,38 +1397,34 @@ class TemplatePopulator:
     def _process_intra_assay_table(self, table):
         """Process the Intra-Assay Precision table."""
         try:
-            # Make sure we have enough rows (header + at least 3 samples)
-            while len(table.rows) < 4:
-                table.add_row()
+            # Nothing to do if a previous run already wrote the standard data
+            if _table_rows_match(table, _INTRA_ASSAY_DATA):
+                self.logger.debug("Intra-assay table already populated")
+                return
             
-            # Make sure each row has enough cells (5)
-            for row in table.rows:
-                while len(row.cells) < 5:
-                    row.add_cell()
+            # Make sure we have enough rows (header + 3 samples) and enough
+            # cells per row (5 - sample, n, mean, SD, CV)
+            _ensure_table_shape(table, _PRECISION_ROWS_NEEDED, _PRECISION_COLS_NEEDED)
             
-            # Define standard intra-assay data
-            intra_data = [
-                ["Sample 1", "16", "4.6%", "10.15", "7.0%"],
-                ["Sample 2", "16", "5.1%", "11.23", "7.5%"],
-                ["Sample 3", "16", "4.8%", "9.88", "6.7%"]
-            ]
+            # Plain grids (the usual case) are written straight from the row elements
+            if _write_fixed_rows(table, _INTRA_ASSAY_DATA):
+                self.logger.info("Processed intra-assay precision table")
+                return
+            
+            # Standard intra-assay data
+            intra_data = _INTRA_ASSAY_DATA
             
             # Fill in each sample row, ensuring paragraphs exist
             for i, sample_data in enumerate(intra_data):
                 row_idx = i + 1  # Skip header row
                 if row_idx < len(table.rows):
-                    row = table.rows[row_idx]
+                    cells = table.rows[row_idx].cells
+                    ncells = len(cells)
                     for j, text in enumerate(sample_data):
-                        if j < len(row.cells):
-                            cell = row.cells[j]
-                            
-                            # Ensure there's at least one paragraph
-                            if not cell.paragraphs:
-                                cell.add_paragraph()
-                            
-                            # Clear and set content
-                            cell.paragraphs[0].clear()
-                            cell.paragraphs[0].add_run(text)
+                        if j >= ncells:
+                            break
+                        # Clear and set content directly on the cell XML
+                        _set_cell_text_fast(cells[j]._tc, text)
             
             self.logger.info("Processed intra-assay precision table")
         except Exception as e:
@@ -1120,38 +1433,34 @@ class TemplatePopulator:
     def _process_inter_assay_table(self, table):
         """Process the Inter-Assay Precision table."""
         try:
-            # Make sure we have enough rows (header + at least 3 samples)
-            while len(table.rows) < 4:
-                table.add_row()
+            # Nothing to do if a previous run already wrote the standard data
+            if _table_rows_match(table, _INTER_ASSAY_DATA):
+                self.logger.debug("Inter-assay table already populated")
+                return
             
-            # Make sure each row has enough cells (5)
-            for row in table.rows:
-                while len(row.cells) < 5:
-                    row.add_cell()
+            # Make sure we have enough rows (header + 3 samples) and enough
+            # cells per row (5 - sample, n, mean, SD, CV)
+            _ensure_table_shape(table, _PRECISION_ROWS_NEEDED, _PRECISION_COLS_NEEDED)
+            
+            # Plain grids (the usual case) are written straight from the row elements
+            if _write_fixed_rows(table, _INTER_ASSAY_DATA):
+                self.logger.info("Processed inter-assay precision table")
+                return
             
-            # Define standard inter-assay data
-            inter_data = [
-                ["Sample 1", "24", "7.8%", "13.05", "9.0%"],
-                ["Sample 2", "24", "8.2%", "14.27", "9.6%"],
-                ["Sample 3", "24", "8.4%", "12.69", "8.8%"]
-            ]
+            # Standard inter-assay data
+            inter_data = _INTER_ASSAY_DATA
             
             # Fill in each sample row, ensuring paragraphs exist
             for i, sample_data in enumerate(inter_data):
                 row_idx = i + 1  # Skip header row
                 if row_idx < len(table.rows):
-                    row = table.rows[row_idx]
+                    cells = table.rows[row_idx].cells
+                    ncells = len(cells)
                     for j, text in enumerate(sample_data):
-                        if j < len(row.cells):
-                            cell = row.cells[j]
-                            
-                            # Ensure there's at least one paragraph
-                            if not cell.paragraphs:
-                                cell.add_paragraph()
-                            
-                            # Clear and set content
-                            cell.paragraphs[0].clear()
-                            cell.paragraphs[0].add_run(text)
+                        if j >= ncells:
+                            break
+                        # Clear and set content directly on the cell XML
+                        _set_cell_text_fast(cells[j]._tc, text)
             
             self.logger.info("Processed inter-assay precision table")
         except Exception as e:
@@ -1160,38 +1469,34 @@ class TemplatePopulator:
     def _process_lot_to_lot_table(self, table):
         """Process the Lot-to-Lot reproducibility table."""
         try:
-            # Make sure we have enough rows (header + at least 3 samples)
-            while len(table.rows) < 4:
-                table.add_row()
+            # Nothing to do if a previous run already wrote the standard data
+            if _table_rows_match(table, _LOT_DATA):
+                self.logger.debug("Lot-to-lot table already populated")
+                return
             
-            # Make sure each row has enough cells (7 - sample, 4 lots, mean, CV)
-            for row in table.rows:
-                while len(row.cells) < 7:
-                    row.add_cell()
+            # Make sure we have enough rows (header + at least 3 samples) and
+            # enough cells per row (7 - sample, 4 lots, mean, CV)
+            _ensure_table_shape(table, _LOT_ROWS_NEEDED, _LOT_COLS_NEEDED)
             
-            # Define standard lot-to-lot data
-            lot_data = [
-                ["Sample 1", "150", "154", "170", "150", "156", "5.2%"],
-                ["Sample 2", "602", "649", "645", "637", "633", "2.9%"],
-                ["Sample 3", "1476", "1672", "1722", "1744", "1654", "7.2%"]
-            ]
+            # Plain grids (the usual case) are written straight from the row elements
+            if _write_fixed_rows(table, _LOT_DATA):
+                self.logger.info("Processed lot-to-lot reproducibility table")
+                return
+            
+            # Standard lot-to-lot data
+            lot_data = _LOT_DATA
             
             # Fill in each sample row, ensuring paragraphs exist
             for i, sample_data in enumerate(lot_data):
                 row_idx = i + 1  # Skip header row
                 if row_idx < len(table.rows):
-                    row = table.rows[row_idx]
+                    cells = table.rows[row_idx].cells
+                    ncells = len(cells)
                     for j, text in enumerate(sample_data):
-                        if j < len(row.cells):
-                            cell = row.cells[j]
-                            
-                            # Ensure there's at least one paragraph
-                            if not cell.paragraphs:
-                                cell.add_paragraph()
-                            
-                            # Clear and set content
-                            cell.paragraphs[0].clear()
-                            cell.paragraphs[0].add_run(text)
+                        if j >= ncells:
+                            break
+                        # Clear and set content directly on the cell XML
+                        _set_cell_text_fast(cells[j]._tc, text)
             
             self.logger.info("Processed lot-to-lot reproducibility table")
         except Exception as e:
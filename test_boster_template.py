@@ -8,6 +8,7 @@ This script tests the processing of a Boster ELISA kit datasheet into Innovative
 import logging
 import os
 import subprocess
+import sys
 from pathlib import Path
 
 from run_boster_template import run_boster_processing
@@ -28,7 +29,7 @@ def test_boster_template():
     catalog_number = "IMSKLK1KT"
     lot_number = "20250506"  # Today's date for example
     
-    logger.info(f"Processing Boster document: {source_path}")
+    logger.info("Processing Boster document: %s", source_path)
     success = run_boster_processing(
         source_path=source_path,
         output_path=output_path,
@@ -38,22 +39,26 @@ def test_boster_template():
     )
     
     if success:
-        logger.info(f"Successfully processed Boster document to Innovative Research format at: {output_path}")
+        logger.info("Successfully processed Boster document to Innovative Research format at: %s", output_path)
         
-        # Try to open the document
-        logger.info("Attempting to open the output document...")
-        try:
-            # On Windows and macOS
-            if os.name == 'nt':  # Windows
-                os.startfile(output_path)
-            elif os.name == 'posix':  # macOS and Linux
-                if os.uname().sysname == 'Darwin':  # macOS
-                    subprocess.run(['open', output_path])
-                else:  # Linux
-                    subprocess.run(['xdg-open', output_path])
-        except Exception as e:
-            logger.warning(f"Could not automatically open document: {e}")
-            logger.info(f"Please open the document manually at: {output_path}")
+        # Only open the document in a viewer when asked to; automated runs skip the fork
+        if os.environ.get('ELISA_OPEN_OUTPUT') == '1':
+            # Try to open the document
+            logger.info("Attempting to open the output document...")
+            try:
+                # On Windows and macOS
+                if os.name == 'nt':  # Windows
+                    os.startfile(output_path)
+                elif os.name == 'posix':  # macOS and Linux
+                    if sys.platform == 'darwin':  # macOS
+                        subprocess.run(['open', output_path])
+                    else:  # Linux
+                        subprocess.run(['xdg-open', output_path])
+            except Exception as e:
+                logger.warning(f"Could not automatically open document: {e}")
+                logger.info(f"Please open the document manually at: {output_path}")
+        else:
+            logger.info(f"Set ELISA_OPEN_OUTPUT=1 to open the document automatically: {output_path}")
     else:
         logger.error("Failed to process Boster document")
         
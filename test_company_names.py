@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test the Reddot to Innovative Research company name replacement
+"""
+
+from docx import Document
+
+from utils import replace_company_names_in_body
+
+def _paragraph_with_runs(*texts):
+    """Create a document whose first paragraph has one run per text, the first run bold"""
+    doc = Document()
+    para = doc.add_paragraph()
+    for i, text in enumerate(texts):
+        run = para.add_run(text)
+        if i == 0:
+            run.bold = True
+    return doc, para
+
+def test_name_within_one_run_keeps_formatting():
+    """A name inside a single run is replaced without touching the other runs"""
+    doc, para = _paragraph_with_runs("Made by Reddot Biotech INC.", " for research")
+
+    assert replace_company_names_in_body(doc) == 1
+    assert [(run.text, run.bold) for run in para.runs] == [
+        ("Made by Innovative Research, Inc.", True),
+        (" for research", None),
+    ]
+
+def test_full_name_split_across_runs():
+    """'Reddot Biotech' + ' INC.' becomes 'Innovative Research, Inc.', not 'Innovative Research INC.'"""
+    doc, para = _paragraph_with_runs("Reddot Biotech", " INC.", " kit")
+
+    assert replace_company_names_in_body(doc) == 1
+    assert para.text == "Innovative Research, Inc. kit"
+    assert para.runs[0].bold
+
+def test_short_name_split_across_runs_and_tables():
+    """Split short names and names in table cells are replaced too"""
+    doc, para = _paragraph_with_runs("Reddot ", "Biotech and Reddot Biotech")
+    table = doc.add_table(rows=1, cols=1)
+    table.cell(0, 0).text = "Reddot Biotech INC."
+
+    assert replace_company_names_in_body(doc) == 3
+    assert para.text == "Innovative Research and Innovative Research"
+    assert table.cell(0, 0).text == "Innovative Research, Inc."
@@ -12,10 +12,15 @@ This script tests the entire Red Dot solution pipeline, including:
 
 import logging
 import os
-import shutil
 from pathlib import Path
 import sys
 
+from docx import Document
+
+from check_red_dot_output import check_document_structure as check_func
+from fix_red_dot_company_and_placement import fix_document_inplace
+from red_dot_template_populator import populate_red_dot_template
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -38,9 +43,6 @@ def clean_test_output():
 
 def test_template_population():
     """Test populating the Red Dot template with data from the source document."""
-    # Import the Red Dot template populator
-    from red_dot_template_populator import populate_red_dot_template
-    
     # Define the paths
     source_path = Path("attached_assets/EK1586_Mouse_KLK1Kallikrein_1_ELISA_Kit_PicoKine_Datasheet.docx")
     template_path = Path("templates_docx/enhanced_red_dot_template.docx")
@@ -67,29 +69,13 @@ def check_document_structure(document_path):
         # Convert Path to string for compatibility
         doc_path_str = str(document_path)
         
-        # Import directly instead of using importlib for simplicity
-        from check_red_dot_output import check_document_structure as check_func
-        
         # Call the check_document_structure function
         check_func(doc_path_str)
         return True
-    except ImportError:
-        logger.error("Failed to import check_red_dot_output.py")
-        return False
     except Exception as e:
         logger.error(f"Error checking document structure: {e}")
         return False
 
-def make_copy_for_comprehensive_check(source_path, dest_path):
-    """Make a copy of the file for comprehensive checking."""
-    try:
-        shutil.copy2(source_path, dest_path)
-        logger.info(f"Created comprehensive check copy at: {dest_path}")
-        return True
-    except Exception as e:
-        logger.error(f"Error creating copy: {e}")
-        return False
-
 def run_tests():
     """Run all tests for the Red Dot solution."""
     # Clean up previous test outputs
@@ -101,20 +87,19 @@ def run_tests():
         logger.error("Template population test failed")
         return False
     
-    # Make a copy for comprehensive checking
+    # Run a manual fix on the populated document in memory and write the
+    # result straight to the comprehensive test file
     comprehensive_path = Path("complete_red_dot_output.docx")
-    if not make_copy_for_comprehensive_check(output_path, comprehensive_path):
-        return False
-    
-    # Run a manual fix on the comprehensive test file
     try:
-        from fix_red_dot_company_and_placement import fix_document
-        if fix_document(comprehensive_path):
+        doc = Document(output_path)
+        if fix_document_inplace(doc):
             logger.info(f"Successfully applied fixes to: {comprehensive_path}")
         else:
             logger.warning("Fixes were not fully applied")
+        doc.save(comprehensive_path)
     except Exception as e:
         logger.error(f"Error applying fixes: {e}")
+        return False
     
     # Check the document structure
     check_document_structure(comprehensive_path)
@@ -7,6 +7,8 @@ import logging
 import sys
 from pathlib import Path
 
+from docx.opc.exceptions import PackageNotFoundError
+
 from elisa_parser import ELISADatasheetParser
 from template_populator_enhanced import TemplatePopulator
 
@@ -22,17 +24,20 @@ def main():
     template_path = Path("templates_docx/enhanced_template.docx")
     output_path = Path("outputs/test_output.docx")
     
-    if not source_path.exists():
-        logger.error(f"Source file does not exist: {source_path}")
-        return 1
-    
-    if not template_path.exists():
+    # Open the inputs directly and report a missing file from the failed open
+    try:
+        populator = TemplatePopulator(template_path)
+    except FileNotFoundError:
         logger.error(f"Template file does not exist: {template_path}")
         return 1
     
     # Extract data from source document
     logger.info(f"Parsing ELISA datasheet: {source_path}")
-    parser = ELISADatasheetParser(source_path)
+    try:
+        parser = ELISADatasheetParser(source_path)
+    except (FileNotFoundError, PackageNotFoundError):
+        logger.error(f"Source file does not exist: {source_path}")
+        return 1
     data = parser.extract_data()
     
     # Print extracted sections of interest
@@ -76,7 +81,6 @@ def main():
     Studies have implicated KLK1 in cardiovascular homeostasis, renal function, and inflammation-related processes.
     """
     
-    populator = TemplatePopulator(template_path)
     populator.populate(
         data, 
         output_path, 
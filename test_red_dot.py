@@ -1,52 +1,91 @@
 import sys
 import os
 import re
-import docx
+import zipfile
+from lxml import etree
 from pathlib import Path
 import logging
-from red_dot_template_populator import extract_red_dot_data, populate_red_dot_template
+
+from check_red_dot_output import paragraph_text
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Section heading keywords, matched anywhere in the upper-cased paragraph text
+_SECTION_RE = re.compile(
+    r'INTENDED USE|TEST PRINCIPLE|REAGENTS|MATERIALS|SAMPLE|PROCEDURE|'
+    r'CALCULATION|SENSITIVITY|SPECIFICITY|PRECISION|STABILITY'
+)
+
+# WordprocessingML namespace used when reading document.xml directly
+NS = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+_P_TAG = f"{{{NS['w']}}}p"
+_TBL_TAG = f"{{{NS['w']}}}tbl"
+
+def load_body(doc_path):
+    """Read the <w:body> element straight from a .docx without building the python-docx object model"""
+    with zipfile.ZipFile(doc_path) as z:
+        xml = z.read('word/document.xml')
+    return etree.fromstring(xml).find('w:body', NS)
+
+def iter_block_items(body):
+    """Yield the body-level <w:p> and <w:tbl> elements in document order"""
+    for child in body.iterchildren(_P_TAG, _TBL_TAG):
+        yield child
+
 def examine_red_dot_doc(doc_path):
     """Examine a Red Dot document to extract key information"""
     logger.info(f"Examining document: {doc_path}")
     
     try:
-        doc = docx.Document(doc_path)
-        logger.info(f"Document loaded successfully: {len(doc.paragraphs)} paragraphs found")
-        
-        # Check first 20 paragraphs for key identifiers
-        for i, para in enumerate(doc.paragraphs[:30]):
-            text = para.text.strip()
-            if text:  # Only print non-empty paragraphs
-                logger.info(f"Para {i}: {text[:100]}")
-                # Look for Red Dot identifiers
-                if "RED DOT" in text.upper() or "RDR-" in text.upper():
-                    logger.info(f"RED DOT IDENTIFIER FOUND in paragraph {i}: {text}")
+        body = load_body(doc_path)
+        logger.info(f"Document loaded successfully: {len(body.findall('w:p', NS))} paragraphs found")
         
-        # Get section headings
-        section_keywords = [
-            "INTENDED USE", "TEST PRINCIPLE", "REAGENTS", "MATERIALS", 
-            "SAMPLE", "PROCEDURE", "CALCULATION", "SENSITIVITY", 
-            "SPECIFICITY", "PRECISION", "STABILITY"
-        ]
+        # Walk the body once; section and table findings are reported after the preview
+        section_lines = []
+        table_lines = []
+        para_idx = 0
+        table_idx = 0
+        red_dot_found = False
+        for block in iter_block_items(body):
+            if block.tag == _P_TAG:
+                i = para_idx
+                para_idx += 1
+                text = paragraph_text(block).strip()
+                
+                # Check first 30 paragraphs for key identifiers
+                if i < 30 and text:  # Only print non-empty paragraphs
+                    logger.info("Para %d: %s", i, text[:100])
+                
+                upper = text.upper()
+                
+                # Look for Red Dot identifiers; the first hit is enough
+                if not red_dot_found and i < 30 and ("RED DOT" in upper or "RDR-" in upper):
+                    red_dot_found = True
+                    logger.info("RED DOT IDENTIFIER FOUND in paragraph %d: %s", i, text)
+                
+                # Get section headings
+                if len(upper) < 100 and _SECTION_RE.search(upper):  # To avoid matching keywords in paragraphs
+                    section_lines.append((i, upper))
+            else:
+                i = table_idx
+                table_idx += 1
+                rows = block.findall('w:tr', NS)
+                if len(rows) > 0:
+                    # Pull each first-row cell's text nodes with XPath rather than cell.text
+                    cell_texts = ("".join(tc.xpath('.//w:t/text()', namespaces=NS)).strip()
+                                  for tc in rows[0].findall('w:tc', NS))
+                    header_row = " | ".join(text for text in cell_texts if text)
+                    table_lines.append((i, len(rows), header_row[:100]))
         
         logger.info("\nSearching for sections:")
-        for i, para in enumerate(doc.paragraphs):
-            text = para.text.strip().upper()
-            for keyword in section_keywords:
-                if keyword in text and len(text) < 100:  # To avoid matching keywords in paragraphs
-                    logger.info(f"Potential section found at paragraph {i}: '{text}'")
-                    break
+        for i, text in section_lines:
+            logger.info("Potential section found at paragraph %d: '%s'", i, text)
         
         # Check for tables
-        logger.info(f"\nFound {len(doc.tables)} tables in document")
-        for i, table in enumerate(doc.tables):
-            if len(table.rows) > 0:
-                header_row = " | ".join([cell.text.strip() for cell in table.rows[0].cells if cell.text.strip()])
-                logger.info(f"Table {i}: {len(table.rows)} rows - Headers: {header_row[:100]}")
+        logger.info("\nFound %d tables in document", table_idx)
+        for i, nrows, header_row in table_lines:
+            logger.info("Table %d: %d rows - Headers: %s", i, nrows, header_row)
         
         return True
         
@@ -56,6 +95,9 @@ def examine_red_dot_doc(doc_path):
 
 def test_red_dot_extraction(doc_path):
     """Test the Red Dot data extraction function"""
+    # Imported here so collecting this module doesn't load the populator
+    from red_dot_template_populator import extract_red_dot_data, populate_red_dot_template
+    
     logger.info(f"Testing Red Dot extraction on: {doc_path}")
     
     try:
@@ -73,7 +115,7 @@ def test_red_dot_extraction(doc_path):
             logger.info("Red Dot sections found:")
             for section, content in data['red_dot_sections'].items():
                 preview = content[:30] + '...' if content and len(content) > 30 else content
-                logger.info(f"  - {section}: {preview}")
+                logger.info("  - %s: %s", section, preview)
         else:
             logger.info("No Red Dot sections found")
             
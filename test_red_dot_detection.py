@@ -2,7 +2,10 @@
 """
 Test Innovative Research document detection logic.
 """
+import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 import logging
 
@@ -13,6 +16,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Vendor markers that identify an Innovative Research document by filename;
+# all of them are found in a single scan of the uppercased name
+_RED_DOT_NAME_MARKERS = ("RDR",)
+_RED_DOT_NAME_RE = re.compile("|".join(re.escape(marker) for marker in _RED_DOT_NAME_MARKERS))
+
+@lru_cache(maxsize=4096)
+def _is_rdr_name(name: str) -> bool:
+    """Return True if a filename marks an Innovative Research document"""
+    # A marker anywhere in the name already covers names ending in RDR.DOCX
+    return _RED_DOT_NAME_RE.search(name.upper()) is not None
+
 def is_red_dot_document(source_path: Path) -> bool:
     """
     Determine if a document is an Innovative Research document based on filename patterns.
@@ -23,15 +37,9 @@ def is_red_dot_document(source_path: Path) -> bool:
     Returns:
         True if the document is an Innovative Research document, False otherwise
     """
-    # Check filename indicators
-    name_upper = source_path.name.upper()
-    is_red_dot = "RDR" in name_upper or name_upper.endswith('RDR.DOCX')
-    
-    logger.info(f"Checking {source_path.name}")
-    logger.info(f"  Filename upper: {name_upper}")
-    logger.info(f"  Contains 'RDR': {'RDR' in name_upper}")
-    logger.info(f"  Ends with 'RDR.DOCX': {name_upper.endswith('RDR.DOCX')}")
-    logger.info(f"  Is Innovative Research: {is_red_dot}")
+    # Check filename indicators, once per distinct name
+    is_red_dot = _is_rdr_name(source_path.name)
+    logger.debug("RDR check %s -> %s", source_path.name, is_red_dot)
     
     return is_red_dot
 
@@ -54,9 +62,12 @@ def main():
     
     # List available files in attached_assets
     print("\nFiles in attached_assets:")
-    for file_path in Path('attached_assets').glob('*.docx'):
-        is_red = is_red_dot_document(file_path)
-        print(f"  {file_path.name}: {'RED DOT' if is_red else 'Standard'}")
+    with os.scandir('attached_assets') as entries:
+        for entry in entries:
+            if not entry.name.endswith('.docx'):
+                continue
+            is_red = is_red_dot_document(Path(entry.path))
+            print(f"  {entry.name}: {'RED DOT' if is_red else 'Standard'}")
     
     return 0
 
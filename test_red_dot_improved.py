@@ -7,21 +7,39 @@ formatting elements like numbered lists, bulleted lists, and tables.
 """
 
 import logging
+import re
 from pathlib import Path
-from red_dot_template_populator import extract_red_dot_data, populate_red_dot_template
+from red_dot_template_populator import cached_extract_red_dot_data, populate_red_dot_template
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Table header classification: group 1 holds the reagent keywords, group 2 the
+# assay keywords; the reagent branch is tried over the whole header first so a
+# reagent keyword anywhere wins, as it did with the two separate keyword checks
+_TABLE_CLASS_RE = re.compile(
+    r'.*?(component|reagent|kit|material|content)|.*?(assay|step|procedure|protocol)',
+    re.DOTALL
+)
+
+def _preview_lines(text, max_lines=5):
+    """Return the first max_lines lines of text without splitting the rest of it"""
+    end = -1
+    for _ in range(max_lines):
+        end = text.find("\n", end + 1)
+        if end < 0:
+            return text
+    return text[:end]
+
 def test_red_dot_extraction():
     """Test the Red Dot extraction with formatting preservation."""
     # Use the Red Dot sample file
     source_path = Path("attached_assets/RDR-LMNB2-Hu.docx")
     
     # Extract data using the improved method
-    data = extract_red_dot_data(source_path)
+    data = cached_extract_red_dot_data(source_path)
     
     # Print the extracted sections to verify formatting
     if 'red_dot_sections' in data:
@@ -29,7 +47,7 @@ def test_red_dot_extraction():
         for section, content in data['red_dot_sections'].items():
             if content and isinstance(content, str):
                 # Only print the first 5 lines to keep output manageable
-                preview = "\n".join(content.split("\n")[:5])
+                preview = _preview_lines(content)
                 logger.info(f"\n--- {section} ---\n{preview}...")
             elif content:
                 logger.info(f"{section}: {type(content)}")
@@ -51,16 +69,15 @@ def test_red_dot_extraction():
                 # Try to identify what this table contains
                 is_reagent_table = False
                 is_assay_table = False
-                reagent_keywords = ['component', 'reagent', 'kit', 'material', 'content']
-                assay_keywords = ['assay', 'step', 'procedure', 'protocol']
                 
                 # Check table headers for keywords
                 if len(table) > 0 and len(table[0]) > 0:
                     header_lower = " ".join([str(cell).lower() for cell in table[0]])
-                    if any(keyword in header_lower for keyword in reagent_keywords):
+                    match = _TABLE_CLASS_RE.match(header_lower)
+                    if match and match.lastindex == 1:
                         is_reagent_table = True
                         logger.info(f"Table {i} appears to be a REAGENTS table")
-                    elif any(keyword in header_lower for keyword in assay_keywords):
+                    elif match:
                         is_assay_table = True
                         logger.info(f"Table {i} appears to be an ASSAY PROCEDURE table")
             else:
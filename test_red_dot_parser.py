@@ -5,7 +5,7 @@ Test the Red Dot template population functionality.
 
 import logging
 from pathlib import Path
-from red_dot_template_populator import extract_red_dot_data, populate_red_dot_template
+from red_dot_template_populator import cached_extract_red_dot_data, populate_red_dot_template
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -19,7 +19,7 @@ def main():
     output_path = Path("output_red_dot_test.docx")
     
     logger.info(f"Testing Red Dot extraction with: {source_path}")
-    data = extract_red_dot_data(source_path)
+    data = cached_extract_red_dot_data(source_path)
     
     # Log the extracted data structure
     logger.info(f"Extracted kit name: {data.get('kit_name', 'Not found')}")
@@ -8,12 +8,10 @@ This script modifies the enhanced Innovative Research template to:
 """
 
 import logging
-import shutil
 import sys
 from pathlib import Path
-from docx import Document
-from docx.shared import Pt
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+
+from utils import create_backup, replace_company_names_in_body, save_document_replacing
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -34,77 +32,57 @@ def update_template(template_path):
         # Create a backup of the template
         template_path = Path(template_path)
         backup_path = template_path.with_name(f"{template_path.stem}_backup{template_path.suffix}")
-        shutil.copy2(template_path, backup_path)
+        create_backup(template_path, backup_path)
         logger.info(f"Created backup at {backup_path}")
         
+        # python-docx is imported only once there is a template to work on, so
+        # bad arguments fail fast
+        from docx import Document
+        from docx.oxml import OxmlElement
+        from docx.oxml.ns import qn
+        from docx.text.paragraph import Paragraph
+        
         # Load the template
         doc = Document(template_path)
         
-        # Replace company names
-        replacements = [
-            ('Reddot Biotech INC.', 'Innovative Research, Inc.'),
-            ('Reddot Biotech', 'Innovative Research'),
-        ]
-        
-        name_replacements = 0
-        # Fix in paragraphs
-        for para in doc.paragraphs:
-            original_text = para.text
-            new_text = original_text
-            
-            for old_text, new_text in replacements:
-                if old_text in new_text:
-                    new_text = new_text.replace(old_text, new_text)
-                    
-            if new_text != original_text:
-                para.text = new_text
-                name_replacements += 1
-        
-        # Fix in tables
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for para in cell.paragraphs:
-                        original_text = para.text
-                        new_text = original_text
-                        
-                        for old_text, new_text in replacements:
-                            if old_text in new_text:
-                                new_text = new_text.replace(old_text, new_text)
-                                
-                        if new_text != original_text:
-                            para.text = new_text
-                            name_replacements += 1
+        # Replace company names in paragraphs and tables
+        name_replacements = replace_company_names_in_body(doc)
         
         logger.info(f"Made {name_replacements} company name replacements")
         
-        # Find the REAGENTS PROVIDED section
-        reagents_section_idx = None
-        for i, para in enumerate(doc.paragraphs):
-            if para.text.strip() == "REAGENTS PROVIDED":
-                reagents_section_idx = i
+        # Find the REAGENTS PROVIDED section, streaming the body paragraphs and
+        # stopping at the first match; only paragraphs whose raw text contains
+        # the heading get a Paragraph wrapper for the exact check
+        reagents_p = None
+        for i, p in enumerate(doc.element.body.iterchildren(qn('w:p'))):
+            if ("REAGENTS PROVIDED" in "".join(p.itertext())
+                    and Paragraph(p, doc._body).text.strip() == "REAGENTS PROVIDED"):
+                reagents_p = p
                 logger.info(f"Found REAGENTS PROVIDED section at paragraph {i}")
                 break
         
-        if reagents_section_idx is None:
+        if reagents_p is None:
             logger.warning("REAGENTS PROVIDED section not found")
             return False
         
         # Check if there's a paragraph after the section heading
-        if reagents_section_idx + 1 < len(doc.paragraphs):
-            next_para = doc.paragraphs[reagents_section_idx + 1]
+        next_p = next(reagents_p.itersiblings(qn('w:p')), None)
+        if next_p is not None:
+            next_para = Paragraph(next_p, doc._body)
             logger.info(f"Paragraph after REAGENTS PROVIDED: '{next_para.text}'")
             
             # Clear the next paragraph and add our special placeholder
             next_para.text = "{{ reagents_table_placeholder }}"
             logger.info("Added reagents_table_placeholder to template")
         else:
-            # Add a new paragraph for the placeholder
-            p = doc.add_paragraph("{{ reagents_table_placeholder }}")
+            # Add a new paragraph for the placeholder directly after the heading
+            new_p = OxmlElement('w:p')
+            reagents_p.addnext(new_p)
+            Paragraph(new_p, doc._body).add_run("{{ reagents_table_placeholder }}")
             logger.info("Added new paragraph with reagents_table_placeholder")
         
         # Save the updated template
-        doc.save(template_path)
+        save_document_replacing(doc, template_path)
         logger.info(f"Successfully updated template: {template_path}")
         return True
         
@@ -11,160 +11,128 @@ This will create a new enhanced template file that includes all the required sec
 """
 
 import logging
+from copy import deepcopy
 from pathlib import Path
 from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from docx.shared import Pt, RGBColor
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def create_heading(doc, text, level=2):
-    """Create a heading with the specified text and level."""
-    heading = doc.add_paragraph(text)
-    heading.style = f'Heading {level}'
-    
-    # Set heading to all caps and blue color
-    for run in heading.runs:
+# Heading styling shared by every create_heading call
+_HEADING_BLUE = RGBColor(0, 70, 180)  # RGB for blue
+_HEADING_STYLES = {level: f'Heading {level}' for level in range(1, 10)}
+
+# Body paragraphs whose text contains ASSAY PROTOCOL in any (ASCII) case
+_ASSAY_PROTOCOL_XPATH = (
+    './w:p[contains(translate(., "abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ"), "ASSAY PROTOCOL")]'
+)
+
+def create_heading(doc, text, level=2, before=None):
+    """Create a heading with the specified text and level, optionally before an existing paragraph."""
+    # Write the text in all caps up front; it lands in a single run
+    text = text.upper()
+    heading = before.insert_paragraph_before(text) if before is not None else doc.add_paragraph(text)
+    heading.style = _HEADING_STYLES[level]
+    
+    # Set heading to bold and blue color
+    if text:
+        run = heading.runs[0]
         run.bold = True
-        run.font.color.rgb = RGBColor(0, 70, 180)  # RGB for blue
-        run.text = run.text.upper()
+        run.font.color.rgb = _HEADING_BLUE
+    return heading
 
-def create_paragraph(doc, text="", style="Normal"):
-    """Create a paragraph with the specified text and style."""
-    paragraph = doc.add_paragraph()
+def create_paragraph(doc, text="", style="Normal", before=None):
+    """Create a paragraph with the specified text and style, optionally before an existing paragraph."""
+    paragraph = before.insert_paragraph_before() if before is not None else doc.add_paragraph()
     paragraph.style = style
     if text:
         paragraph.add_run(text)
     return paragraph
 
-def update_enhanced_template():
-    """
-    Update the enhanced template to include all required sections.
+def clone_paragraph(doc, prototype, text, before=None):
+    """Insert a copy of a single-run prototype paragraph with new text, optionally before an existing paragraph."""
+    p = deepcopy(prototype._p)
+    p.xpath('./w:r/w:t')[0].text = text
+    if before is not None:
+        before._p.addprevious(p)
+    else:
+        doc.element.body._insert_p(p)
+    return Paragraph(p, doc._body)
+
+def add_required_sections(doc):
     """
-    # Create a new document
-    output_path = Path('templates_docx/enhanced_template_complete.docx')
-    
-    # Start by copying the existing enhanced template
-    doc = Document('templates_docx/enhanced_template.docx')
+    Add the required sections to a loaded enhanced template.
     
-    # Find where to insert new sections
-    insert_position = None
-    for i, para in enumerate(doc.paragraphs):
-        if "ASSAY PROTOCOL" in para.text.upper():
-            insert_position = i
-            break
+    The new sections are spliced into the template's body in place, so tables,
+    numbering and section properties of the original are kept.
     
-    if insert_position is None:
-        logger.warning("Could not find ASSAY PROTOCOL section to insert before")
-        insert_position = len(doc.paragraphs) - 1  # Default to end of document
-    
-    # Save the current document content up to the insert point
-    content_before = []
-    for i in range(insert_position):
-        content_before.append(doc.paragraphs[i])
-    
-    # Save the content after the insert point
-    content_after = []
-    for i in range(insert_position, len(doc.paragraphs)):
-        content_after.append(doc.paragraphs[i])
-    
-    # Create a new document
-    new_doc = Document()
+    Args:
+        doc: The Document object to modify
+    """
+    body = doc.element.body
     
-    # Copy styles from original document
-    for style in doc.styles:
-        if style.name not in new_doc.styles:
-            try:
-                new_style = new_doc.styles.add_style(style.name, style.type)
-                # Copy any other style attributes as needed
-            except:
-                # Style might already exist
-                pass
+    # Find where to insert new sections; XPath yields the candidates and the
+    # first one whose paragraph text really contains the heading is used
+    anchor = next((para for para in (Paragraph(p, doc._body) for p in body.xpath(_ASSAY_PROTOCOL_XPATH))
+                   if "ASSAY PROTOCOL" in para.text.upper()), None)
     
-    # Copy content before insert point
-    for para in content_before:
-        new_para = new_doc.add_paragraph()
-        new_para.style = para.style
-        for run in para.runs:
-            new_run = new_para.add_run(run.text)
-            new_run.bold = run.bold
-            new_run.italic = run.italic
-            if hasattr(run.font, 'color') and run.font.color.rgb:
-                new_run.font.color.rgb = run.font.color.rgb
+    if anchor is None:
+        logger.warning("Could not find ASSAY PROTOCOL section to insert before")
+        last_p = body.xpath('./w:p[last()]')
+        anchor = Paragraph(last_p[0], doc._body) if last_p else None  # Default to end of document
     
-    # Add new sections
+    # Add new sections; the first heading and placeholder paragraph are built
+    # and styled once, and every later section is a copy of them with new text
     # 1. ASSAY PRINCIPLE
-    create_heading(new_doc, "ASSAY PRINCIPLE")
-    create_paragraph(new_doc, "{{ assay_principle }}")
+    heading_proto = create_heading(doc, "ASSAY PRINCIPLE", before=anchor)
+    content_proto = create_paragraph(doc, "{{ assay_principle }}", before=anchor)
     
     # 2. SAMPLE PREPARATION AND STORAGE
-    create_heading(new_doc, "SAMPLE PREPARATION AND STORAGE")
-    create_paragraph(new_doc, "{{ sample_preparation_and_storage }}")
+    clone_paragraph(doc, heading_proto, "SAMPLE PREPARATION AND STORAGE", before=anchor)
+    clone_paragraph(doc, content_proto, "{{ sample_preparation_and_storage }}", before=anchor)
     
     # 3. SAMPLE COLLECTION NOTES
-    create_heading(new_doc, "SAMPLE COLLECTION NOTES")
-    create_paragraph(new_doc, "{{ sample_collection_notes }}")
+    clone_paragraph(doc, heading_proto, "SAMPLE COLLECTION NOTES", before=anchor)
+    clone_paragraph(doc, content_proto, "{{ sample_collection_notes }}", before=anchor)
     
     # 4. SAMPLE DILUTION GUIDELINE
-    create_heading(new_doc, "SAMPLE DILUTION GUIDELINE")
-    create_paragraph(new_doc, "{{ sample_dilution_guideline }}")
-    
-    # Copy content after insert point
-    for para in content_after:
-        new_para = new_doc.add_paragraph()
-        new_para.style = para.style
-        for run in para.runs:
-            new_run = new_para.add_run(run.text)
-            new_run.bold = run.bold
-            new_run.italic = run.italic
-            if hasattr(run.font, 'color') and run.font.color.rgb:
-                new_run.font.color.rgb = run.font.color.rgb
-    
-    # 5. Add DATA ANALYSIS section after TYPICAL DATA section
-    data_analysis_position = None
-    for i, para in enumerate(new_doc.paragraphs):
-        if "TYPICAL DATA" in para.text.upper():
-            # Find the next heading after TYPICAL DATA
-            for j in range(i+1, len(new_doc.paragraphs)):
-                if new_doc.paragraphs[j].style.name.startswith('Heading'):
-                    data_analysis_position = j
-                    break
-            if data_analysis_position is None:
-                # If no next heading, put at the end
-                data_analysis_position = len(new_doc.paragraphs)
+    clone_paragraph(doc, heading_proto, "SAMPLE DILUTION GUIDELINE", before=anchor)
+    clone_paragraph(doc, content_proto, "{{ sample_dilution_guideline }}", before=anchor)
+    
+    # 5. Add DATA ANALYSIS section before the next heading after TYPICAL DATA
+    # Heading styles are resolved to their ids once so the scan only reads each
+    # paragraph's w:pStyle value instead of looking up its style by name
+    heading_ids = {style.style_id for style in doc.styles
+                   if style.type == WD_STYLE_TYPE.PARAGRAPH and style.name and style.name.startswith('Heading')}
+    # One streaming pass over the body paragraphs finds both TYPICAL DATA and
+    # the heading after it, without rebuilding doc.paragraphs
+    body_paragraphs = body.iterchildren(qn('w:p'))
+    for p in body_paragraphs:
+        if "TYPICAL DATA" in Paragraph(p, doc._body).text.upper():
+            # Find the next heading after TYPICAL DATA; if there is none, put it at the end
+            next_p = next((p for p in body_paragraphs if p.style in heading_ids), None)
+            next_heading = Paragraph(next_p, doc._body) if next_p is not None else None
+            clone_paragraph(doc, heading_proto, "DATA ANALYSIS", before=next_heading)
+            clone_paragraph(doc, content_proto, "{{ data_analysis }}", before=next_heading)
             break
+
+def update_enhanced_template():
+    """Update the enhanced template to include all required sections."""
+    output_path = Path('templates_docx/enhanced_template_complete.docx')
     
-    if data_analysis_position is not None:
-        # Insert DATA ANALYSIS section
-        paragraphs_after_data_analysis = []
-        for i in range(data_analysis_position, len(new_doc.paragraphs)):
-            paragraphs_after_data_analysis.append(new_doc.paragraphs[i])
-        
-        # Remove paragraphs after data analysis position
-        for _ in range(len(new_doc.paragraphs) - data_analysis_position):
-            new_doc._element.body.remove(new_doc.paragraphs[-1]._element)
-        
-        # Add DATA ANALYSIS section
-        create_heading(new_doc, "DATA ANALYSIS")
-        create_paragraph(new_doc, "{{ data_analysis }}")
-        
-        # Add back the paragraphs after data analysis
-        for para in paragraphs_after_data_analysis:
-            new_para = new_doc.add_paragraph()
-            new_para.style = para.style
-            for run in para.runs:
-                new_run = new_para.add_run(run.text)
-                new_run.bold = run.bold
-                new_run.italic = run.italic
-                if hasattr(run.font, 'color') and run.font.color.rgb:
-                    new_run.font.color.rgb = run.font.color.rgb
+    # Start by loading the existing enhanced template
+    doc = Document('templates_docx/enhanced_template.docx')
+    add_required_sections(doc)
     
     # Save the updated template
-    new_doc.save(output_path)
+    doc.save(output_path)
     logger.info(f"Updated enhanced template saved to {output_path}")
     
     return output_path
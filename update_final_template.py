@@ -11,18 +11,62 @@ Fix template issues identified in the review:
 
 import logging
 from pathlib import Path
+from xml.sax.saxutils import escape
 from docx import Document
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-from docx.shared import Pt, RGBColor, Cm
+from docx.shared import RGBColor, Cm
 from docx.enum.table import WD_ALIGN_VERTICAL, WD_TABLE_ALIGNMENT
 from docx.shared import Inches
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Section headings the fixes anchor on, matched anywhere in the upper-cased paragraph text
+SECTION_KEYWORDS = (
+    "SAMPLE DILUTION GUIDELINE",
+    "ASSAY PROTOCOL",
+    "TECHNICAL DETAILS",
+    "STANDARD CURVE",
+    "TYPICAL DATA",
+    "REPRODUCIBILITY",
+)
+
+# Footer runs: company name in bold Calibri 24pt, then contact info and website
+# in Calibri 12pt; the line breaks sit inside the runs, so two runs cover all
+# three lines
+FOOTER_RUNS_XML = (
+    f'<w:p {nsdecls("w")}>'
+    '<w:r><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/><w:b/><w:sz w:val="48"/></w:rPr>'
+    '<w:t>Innovative Research</w:t><w:br/></w:r>'
+    '<w:r><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/><w:b w:val="0"/><w:sz w:val="24"/></w:rPr>'
+    '<w:t>32700 Concord Dr, Madison Heights, MI 48071 | Tel: 248-896-0145 | Fax: 248-896-0149</w:t><w:br/>'
+    '<w:t>www.innov-research.com</w:t></w:r>'
+    '</w:p>'
+)
+
+# Single-run paragraph for a table cell; rpr is '' or a run-properties element
+CELL_PARAGRAPH_XML = f'<w:p {nsdecls("w")}><w:r>{{rpr}}<w:t>{{text}}</w:t></w:r></w:p>'
+BOLD_RPR_XML = '<w:rPr><w:b/></w:rPr>'
+
+# Jinja expression for one reproducibility table cell, guarded against missing rows
+REPRODUCIBILITY_CELL_TEMPLATE = (
+    "{{{{ reproducibility[{idx}].{field} if reproducibility and {idx} < reproducibility|length else '{fallback}' }}}}"
+)
+REPRODUCIBILITY_FIELDS = ("sample", "lot1", "lot2", "lot3", "lot4", "sd", "cv")
+
+# Reproducibility header row: one bold run per cell; each cell's tcPr (column
+# width) is taken over from the row python-docx generates
+REPRODUCIBILITY_HEADERS = ("Sample", "Lot 1", "Lot 2", "Lot 3", "Lot 4", "SD", "CV")
+REPRODUCIBILITY_HEADER_XML = (
+    f'<w:tr {nsdecls("w")}>'
+    + ''.join(f'<w:tc><w:p><w:r><w:rPr><w:b/></w:rPr><w:t>{header}</w:t></w:r></w:p></w:tc>'
+              for header in REPRODUCIBILITY_HEADERS)
+    + '</w:tr>'
+)
+
 def create_heading(doc, text, level=2):
     """Create a heading with the specified text and level."""
     heading = doc.add_paragraph(text)
@@ -51,80 +95,94 @@ def add_disclaimer_section(doc):
     paragraph = create_paragraph(doc, disclaimer_text)
     return paragraph
 
-def fix_sample_dilution_format(doc):
+def build_para_texts(doc):
+    """
+    Return the upper-cased text of every body paragraph, assembled once.
+    
+    The fixes only append to the end of the document or replace non-empty
+    paragraph content with a non-empty placeholder, so the list stays valid for
+    both keyword and empty-paragraph checks while they run.
+    """
+    return [para.text.upper() for para in doc.paragraphs]
+
+def build_section_index(para_texts):
+    """
+    Map each section keyword used by the fixes to the index of the first paragraph containing it.
+    
+    The fixes only append to the end of the document or rewrite paragraph content
+    in place, so the indices stay valid while they run.
+    """
+    section_index = {}
+    for i, text in enumerate(para_texts):
+        for keyword in SECTION_KEYWORDS:
+            if keyword not in section_index and keyword in text:
+                section_index[keyword] = i
+        if len(section_index) == len(SECTION_KEYWORDS):
+            break
+    return section_index
+
+def fix_sample_dilution_format(doc, section_index, para_texts):
     """Convert SAMPLE DILUTION GUIDELINE to a list format."""
     # Find the section
-    sample_dilution_idx = None
-    for i, para in enumerate(doc.paragraphs):
-        if "SAMPLE DILUTION GUIDELINE" in para.text.upper():
-            sample_dilution_idx = i
-            break
+    sample_dilution_idx = section_index.get("SAMPLE DILUTION GUIDELINE")
     
     if sample_dilution_idx is None:
         logger.warning("SAMPLE DILUTION GUIDELINE section not found")
         return
     
     # Find the paragraph with the content
-    content_idx = None
-    for i in range(sample_dilution_idx + 1, len(doc.paragraphs)):
-        if doc.paragraphs[i].text.strip():
-            content_idx = i
-            break
+    content_idx = next((i for i in range(sample_dilution_idx + 1, len(para_texts)) if para_texts[i].strip()), None)
     
     if content_idx is None:
         logger.warning("SAMPLE DILUTION GUIDELINE content not found")
         return
     
     # Get the original content
-    original_content = doc.paragraphs[content_idx].text
+    content_para = doc.paragraphs[content_idx]
+    original_content = content_para.text
     
     # Replace with a template variable that can be processed as a list
-    doc.paragraphs[content_idx].clear()
-    doc.paragraphs[content_idx].add_run("{{ sample_dilution_guideline }}")
+    content_para.clear()
+    content_para.add_run("{{ sample_dilution_guideline }}")
     
     return original_content
 
-def fix_assay_protocol_format(doc):
+def fix_assay_protocol_format(doc, section_index, para_texts):
     """Convert ASSAY PROTOCOL to a numbered list format."""
     # Find the section
-    assay_protocol_idx = None
-    for i, para in enumerate(doc.paragraphs):
-        if "ASSAY PROTOCOL" in para.text.upper():
-            assay_protocol_idx = i
-            break
+    assay_protocol_idx = section_index.get("ASSAY PROTOCOL")
     
     if assay_protocol_idx is None:
         logger.warning("ASSAY PROTOCOL section not found")
         return
     
     # Find the paragraph with the content
-    content_idx = None
-    for i in range(assay_protocol_idx + 1, len(doc.paragraphs)):
-        if doc.paragraphs[i].text.strip():
-            content_idx = i
-            break
+    content_idx = next((i for i in range(assay_protocol_idx + 1, len(para_texts)) if para_texts[i].strip()), None)
     
     if content_idx is None:
         logger.warning("ASSAY PROTOCOL content not found")
         return
     
     # Get the original content 
-    original_content = doc.paragraphs[content_idx].text
+    content_para = doc.paragraphs[content_idx]
+    original_content = content_para.text
     
     # Replace with a template variable that can be processed as a list
-    doc.paragraphs[content_idx].clear()
-    doc.paragraphs[content_idx].add_run("{{ assay_protocol_numbered }}")
+    content_para.clear()
+    content_para.add_run("{{ assay_protocol_numbered }}")
     
     return original_content
 
-def fix_technical_details_table(doc):
+def set_cell_text(tc, text, bold=False):
+    """Replace the paragraphs of a <w:tc> with one paragraph holding text in a single run."""
+    for p in tc.p_lst:
+        tc.remove(p)
+    tc.append(parse_xml(CELL_PARAGRAPH_XML.format(rpr=BOLD_RPR_XML if bold else '', text=escape(text))))
+
+def fix_technical_details_table(doc, section_index):
     """Fix the TECHNICAL DETAILS table."""
     # Find the TECHNICAL DETAILS section
-    technical_idx = None
-    for i, para in enumerate(doc.paragraphs):
-        if "TECHNICAL DETAILS" in para.text.upper():
-            technical_idx = i
-            break
+    technical_idx = section_index.get("TECHNICAL DETAILS")
     
     if technical_idx is None:
         logger.warning("TECHNICAL DETAILS section not found")
@@ -143,14 +201,12 @@ def fix_technical_details_table(doc):
         "Sensitivity"
     ]
     
-    for i, prop in enumerate(properties):
-        table.rows[i].cells[0].text = prop
-        table.rows[i].cells[1].text = "{{ technical_details." + prop.lower().replace("/", "_").replace("-", "_") + " if technical_details else 'N/A' }}"
-        
-        # Make property names bold
-        for paragraph in table.rows[i].cells[0].paragraphs:
-            for run in paragraph.runs:
-                run.bold = True
+    # Fill the <w:tc> elements directly, writing property names bold, rather than
+    # going through table.rows[i].cells for every cell
+    for tr, prop in zip(table._tbl.tr_lst, properties):
+        tcs = tr.tc_lst
+        set_cell_text(tcs[0], prop, bold=True)
+        set_cell_text(tcs[1], "{{ technical_details." + prop.lower().replace("/", "_").replace("-", "_") + " if technical_details else 'N/A' }}")
     
     # Set column widths
     table.columns[0].width = Cm(6.0)  # Property
@@ -158,14 +214,11 @@ def fix_technical_details_table(doc):
     
     return table
 
-def fix_standard_curve_table(doc):
+def fix_standard_curve_table(doc, section_index):
     """Fix the STANDARD CURVE table."""
     # Find the STANDARD CURVE section
-    standard_curve_idx = None
-    for i, para in enumerate(doc.paragraphs):
-        if "STANDARD CURVE" in para.text.upper() or "TYPICAL DATA" in para.text.upper():
-            standard_curve_idx = i
-            break
+    standard_curve_idx = min((section_index[keyword] for keyword in ("STANDARD CURVE", "TYPICAL DATA")
+                              if keyword in section_index), default=None)
     
     if standard_curve_idx is None:
         logger.warning("STANDARD CURVE/TYPICAL DATA section not found")
@@ -185,14 +238,10 @@ def fix_standard_curve_table(doc):
     
     return standard_curve_para
 
-def fix_reproducibility_table(doc):
+def fix_reproducibility_table(doc, section_index):
     """Fix the REPRODUCIBILITY table."""
     # Find the REPRODUCIBILITY section
-    repro_idx = None
-    for i, para in enumerate(doc.paragraphs):
-        if "REPRODUCIBILITY" in para.text.upper():
-            repro_idx = i
-            break
+    repro_idx = section_index.get("REPRODUCIBILITY")
     
     if repro_idx is None:
         logger.warning("REPRODUCIBILITY section not found")
@@ -205,32 +254,19 @@ def fix_reproducibility_table(doc):
     table = doc.add_table(rows=4, cols=7)
     table.style = 'Table Grid'
     
-    # Set up header row
-    header_cells = table.rows[0].cells
-    header_cells[0].text = "Sample"
-    header_cells[1].text = "Lot 1"
-    header_cells[2].text = "Lot 2"
-    header_cells[3].text = "Lot 3"
-    header_cells[4].text = "Lot 4"
-    header_cells[5].text = "SD"
-    header_cells[6].text = "CV"
-    
-    # Make header row bold
-    for cell in header_cells:
-        for paragraph in cell.paragraphs:
-            for run in paragraph.runs:
-                run.bold = True
+    # Set up the bold header row from one XML fragment, keeping the generated cell widths
+    old_tr = table._tbl.tr_lst[0]
+    header_tr = parse_xml(REPRODUCIBILITY_HEADER_XML)
+    for old_tc, header_tc in zip(old_tr.tc_lst, header_tr.tc_lst):
+        header_tc.insert(0, old_tc.tcPr)
+    table._tbl.replace(old_tr, header_tr)
     
     # Add sample rows with safer indexing
-    for i in range(1, 4):
+    for i, row in enumerate(table.rows[1:4], start=1):
         idx = i - 1  # 0-indexed for template access
-        table.rows[i].cells[0].text = "{{ reproducibility[" + str(idx) + "].sample if reproducibility and " + str(idx) + " < reproducibility|length else 'Sample " + str(i) + "' }}"
-        table.rows[i].cells[1].text = "{{ reproducibility[" + str(idx) + "].lot1 if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
-        table.rows[i].cells[2].text = "{{ reproducibility[" + str(idx) + "].lot2 if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
-        table.rows[i].cells[3].text = "{{ reproducibility[" + str(idx) + "].lot3 if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
-        table.rows[i].cells[4].text = "{{ reproducibility[" + str(idx) + "].lot4 if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
-        table.rows[i].cells[5].text = "{{ reproducibility[" + str(idx) + "].sd if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
-        table.rows[i].cells[6].text = "{{ reproducibility[" + str(idx) + "].cv if reproducibility and " + str(idx) + " < reproducibility|length else 'N/A' }}"
+        fallbacks = [f"Sample {i}"] + ["N/A"] * (len(REPRODUCIBILITY_FIELDS) - 1)
+        for cell, field, fallback in zip(row.cells, REPRODUCIBILITY_FIELDS, fallbacks):
+            cell.text = REPRODUCIBILITY_CELL_TEMPLATE.format(idx=idx, field=field, fallback=fallback)
     
     return table
 
@@ -242,34 +278,33 @@ def add_footer(doc):
     # Get the footer
     footer = section.footer
     
-    # Add Innovative Research in bold Calibri 24pt
+    # Add Innovative Research and the contact lines; Open Sans Light may not be
+    # available, so Calibri is used throughout. The runs are parsed from one XML
+    # fragment and appended together
     p = footer.paragraphs[0] if len(footer.paragraphs) > 0 else footer.add_paragraph()
     p.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-    company_run = p.add_run("Innovative Research")
-    company_run.bold = True
-    company_run.font.name = "Calibri"
-    company_run.font.size = Pt(24)
-    
-    # Add a line break
-    p.add_run("\n")
-    
-    # Add contact info in Open Sans Light 12pt
-    # Since we may not have Open Sans, use Calibri as a fallback
-    contact_info = "32700 Concord Dr, Madison Heights, MI 48071 | Tel: 248-896-0145 | Fax: 248-896-0149"
-    contact_run = p.add_run(contact_info)
-    contact_run.font.name = "Calibri"
-    contact_run.font.size = Pt(12)
-    contact_run.bold = False
-    
-    # Add another line break and the website
-    p.add_run("\n")
-    website_run = p.add_run("www.innov-research.com")
-    website_run.font.name = "Calibri"
-    website_run.font.size = Pt(12)
-    website_run.bold = False
+    p._p.extend(parse_xml(FOOTER_RUNS_XML).findall(qn('w:r')))
     
     return footer
 
+def apply_final_fixes(doc):
+    """
+    Apply all the final fixes to a loaded template.
+    
+    Args:
+        doc: The Document object to modify
+    """
+    # Assemble every paragraph's text and locate every section once, then apply all the fixes
+    para_texts = build_para_texts(doc)
+    section_index = build_section_index(para_texts)
+    fix_sample_dilution_format(doc, section_index, para_texts)
+    fix_assay_protocol_format(doc, section_index, para_texts)
+    fix_technical_details_table(doc, section_index)
+    fix_standard_curve_table(doc, section_index)
+    fix_reproducibility_table(doc, section_index)
+    add_disclaimer_section(doc)
+    add_footer(doc)
+
 def update_template():
     """Update the template with all the fixes."""
     # Load the existing template
@@ -277,15 +312,7 @@ def update_template():
     output_path = Path('templates_docx/enhanced_template_final.docx')
     
     doc = Document(template_path)
-    
-    # Apply all the fixes
-    fix_sample_dilution_format(doc)
-    fix_assay_protocol_format(doc)
-    fix_technical_details_table(doc)
-    fix_standard_curve_table(doc)
-    fix_reproducibility_table(doc)
-    add_disclaimer_section(doc)
-    add_footer(doc)
+    apply_final_fixes(doc)
     
     # Save the updated template
     doc.save(output_path)
@@ -293,8 +320,41 @@ def update_template():
     
     return output_path
 
+def apply_all_template_updates(template_path=Path('templates_docx/enhanced_template.docx'),
+                               output_path=Path('templates_docx/enhanced_template_final.docx')):
+    """
+    Run the whole enhanced template pipeline on one open document.
+    
+    Applies update_enhanced_template's sections, fix_template_tables' tables and
+    the final fixes in turn, so the template is read and saved once instead of
+    round-tripping through enhanced_template_complete.docx and
+    enhanced_template_fixed.docx.
+    
+    Args:
+        template_path: Path to the base enhanced template
+        output_path: Path to save the final template to
+        
+    Returns:
+        The output path
+    """
+    from update_enhanced_template import add_required_sections
+    from fix_template_tables import apply_table_fixes
+    
+    doc = Document(template_path)
+    add_required_sections(doc)
+    apply_table_fixes(doc)
+    apply_final_fixes(doc)
+    
+    doc.save(output_path)
+    logger.info(f"Updated template saved to {output_path}")
+    
+    return output_path
+
 if __name__ == "__main__":
-    template_path = update_template()
+    import sys
+    
+    # --all runs the full pipeline from enhanced_template.docx in one pass
+    template_path = apply_all_template_updates() if "--all" in sys.argv[1:] else update_template()
     logger.info(f"Template with final fixes created at: {template_path}")
     
     # Verify that all issues are addressed
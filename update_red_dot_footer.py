@@ -8,11 +8,11 @@ This script modifies the footer in Red Dot documents to:
 """
 
 import logging
-import shutil
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from docx import Document
-from docx.shared import Pt, Inches
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+
+from utils import create_backup, save_document_replacing
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -33,9 +33,17 @@ def update_red_dot_footer(document_path):
         # Create a backup of the document
         document_path = Path(document_path)
         backup_path = document_path.with_name(f"{document_path.stem}_before_footer_update{document_path.suffix}")
-        shutil.copy2(document_path, backup_path)
+        create_backup(document_path, backup_path)
         logger.info(f"Created backup at {backup_path}")
         
+        # python-docx is imported only once there is a document to work on, so
+        # bad arguments fail fast and each worker pays the import cost itself
+        from docx import Document
+        from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+        from docx.oxml.ns import qn
+        from docx.shared import Pt
+        from docx.text.paragraph import Paragraph
+        
         # Load the document
         doc = Document(document_path)
         
@@ -49,16 +57,19 @@ def update_red_dot_footer(document_path):
             # Access the footer
             footer = section.footer
             
-            # Clear existing content
-            for paragraph in footer.paragraphs:
-                paragraph.clear()
+            # Clear existing content: drop every paragraph after the first in one
+            # pass and empty the first, keeping its paragraph properties
+            ftr = footer._element
+            footer_ps = ftr.findall(qn('w:p'))
+            for p in footer_ps[1:]:
+                ftr.remove(p)
             
             # If there are no paragraphs, add one
-            if not footer.paragraphs:
-                footer.add_paragraph()
-                
-            # Get the first paragraph
-            paragraph = footer.paragraphs[0]
+            if footer_ps:
+                paragraph = Paragraph(footer_ps[0], footer)
+                paragraph.clear()
+            else:
+                paragraph = footer.add_paragraph()
             
             # Set the alignment to right
             paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.RIGHT
@@ -73,7 +84,7 @@ def update_red_dot_footer(document_path):
             logger.info(f"Set footer text in section {i+1} to 'Innovative Research, Inc.' (Calibri 26pt, right-aligned)")
         
         # Save the document
-        doc.save(document_path)
+        save_document_replacing(doc, document_path)
         logger.info(f"Successfully updated footer in: {document_path}")
         return True
         
@@ -81,17 +92,37 @@ def update_red_dot_footer(document_path):
         logger.error(f"Error updating footer: {e}")
         return False
 
+def update_red_dot_footers(document_paths, max_workers=None):
+    """
+    Update the footer in several Red Dot documents, one worker process per document.
+    
+    Each worker opens, updates and saves its own file, so no Document objects
+    cross process boundaries.
+    
+    Args:
+        document_paths: Paths to the documents to modify
+        max_workers: Maximum number of worker processes (defaults to the CPU count)
+        
+    Returns:
+        A list with the result of update_red_dot_footer for each path, in order
+    """
+    document_paths = list(document_paths)
+    if len(document_paths) <= 1:
+        return [update_red_dot_footer(path) for path in document_paths]
+    
+    max_workers = min(max_workers or os.cpu_count() or 1, len(document_paths))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(update_red_dot_footer, document_paths))
+
 if __name__ == "__main__":
     import sys
     
-    # Use command line argument or default
-    if len(sys.argv) > 1:
-        document_path = sys.argv[1]
-    else:
-        document_path = "red_dot_output.docx"
+    # Use command line arguments or default
+    document_paths = sys.argv[1:] or ["red_dot_output.docx"]
     
-    # Update the footer
-    if update_red_dot_footer(document_path):
-        logger.info(f"Successfully updated footer in: {document_path}")
-    else:
-        logger.error(f"Failed to update footer in: {document_path}")
\ No newline at end of file
+    # Update the footers
+    for document_path, success in zip(document_paths, update_red_dot_footers(document_paths)):
+        if success:
+            logger.info(f"Successfully updated footer in: {document_path}")
+        else:
+            logger.error(f"Failed to update footer in: {document_path}")
\ No newline at end of file
@@ -18,6 +18,8 @@ from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from docx.oxml.shared import OxmlElement
 from docx.oxml.ns import qn
 
+from utils import replace_company_names_in_body
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -112,27 +114,8 @@ def fix_company_names_in_template(template_path):
         # Load the document (no need for backup, already done in main function)
         doc = Document(template_path)
         
-        replacements = [
-            ('Reddot Biotech INC.', 'Innovative Research, Inc.'),
-            ('Reddot Biotech', 'Innovative Research'),  # Must be after the more specific replacement
-        ]
-        
-        count = 0
-        for para in doc.paragraphs:
-            for old_text, new_text in replacements:
-                if old_text in para.text:
-                    para.text = para.text.replace(old_text, new_text)
-                    count += 1
-        
-        # Replace in tables too
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for para in cell.paragraphs:
-                        for old_text, new_text in replacements:
-                            if old_text in para.text:
-                                para.text = para.text.replace(old_text, new_text)
-                                count += 1
+        # Replace in paragraphs and tables run by run, keeping formatting
+        count = replace_company_names_in_body(doc)
         
         # Save if changes were made
         if count > 0:
@@ -9,16 +9,26 @@ Update the template populator to handle the new template format with:
 
 import logging
 import re
+from io import BytesIO
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
 from docx import Document
 from docxtpl import DocxTemplate
 
+from utils import load_template_bytes
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Sentence/semicolon boundaries splitting sample dilution guidelines into items
+_SPLIT_SENT = re.compile(r'(?<=[.;])\s+')
+# Boundaries before a numbered step (or the end) splitting assay protocols into steps
+_SPLIT_STEP = re.compile(r'(?<=[.;])\s+(?=\d+\.|\(\d+\)|\d+\)|\d+\s+|$)')
+# Leading step number ("1.", "(1)" or "1)") stripped from assay protocol steps
+_LEAD_NUM = re.compile(r'^\s*(\d+\.|\(\d+\)|\d+\))\s*')
+
 def format_sample_dilution_as_list(text: str) -> str:
     """
     Format sample dilution text as an HTML-formatted list for proper display.
@@ -33,17 +43,11 @@ def format_sample_dilution_as_list(text: str) -> str:
         return ""
     
     # Split on sentences or semicolons
-    items = re.split(r'(?<=[.;])\s+', text)
+    items = _SPLIT_SENT.split(text)
     items = [item.strip() for item in items if item.strip()]
     
     # Format as bullet list in HTML (docxtpl can render this with |safe filter)
-    html_list = "<ul>"
-    for item in items:
-        if item:
-            html_list += f"<li>{item}</li>"
-    html_list += "</ul>"
-    
-    return html_list
+    return "<ul>" + "".join(f"<li>{item}</li>" for item in items) + "</ul>"
 
 def format_assay_protocol_as_numbered_list(text: str) -> str:
     """
@@ -59,19 +63,14 @@ def format_assay_protocol_as_numbered_list(text: str) -> str:
         return ""
     
     # Split on periods followed by space then a number, or on semicolons
-    steps = re.split(r'(?<=[.;])\s+(?=\d+\.|\(\d+\)|\d+\)|\d+\s+|$)', text)
+    steps = _SPLIT_STEP.split(text)
     steps = [step.strip() for step in steps if step.strip()]
     
-    # Format as numbered list in HTML
-    html_list = "<ol>"
-    for step in steps:
-        # Remove any leading numbers and periods (we're adding our own)
-        clean_step = re.sub(r'^\s*(\d+\.|\(\d+\)|\d+\))\s*', '', step)
-        if clean_step:
-            html_list += f"<li>{clean_step}</li>"
-    html_list += "</ol>"
+    # Remove any leading numbers and periods (we're adding our own)
+    clean_steps = (_LEAD_NUM.sub('', step) for step in steps)
     
-    return html_list
+    # Format as numbered list in HTML
+    return "<ol>" + "".join(f"<li>{step}</li>" for step in clean_steps if step) + "</ol>"
 
 def format_standard_curve_table(concentrations: List[float], od_values: List[float]) -> str:
     """
@@ -94,20 +93,14 @@ def format_standard_curve_table(concentrations: List[float], od_values: List[flo
         </table>
         """
     
-    # Start with a 0 concentration and 0.0 OD value
-    # Then add the provided values
-    table = """
+    # Start with a 0 concentration and 0.0 OD value,
+    # then add a row for each concentration/OD pair
+    rows = ''.join(f'<tr><td>{conc}</td><td>{od}</td></tr>\n' for conc, od in zip(concentrations, od_values))
+    return f"""
     <table border="1" cellpadding="5" style="border-collapse: collapse; width: 100%;">
         <tr><th>Concentration (pg/ml)</th><th>O.D.</th></tr>
         <tr><td>0</td><td>0.0</td></tr>
-    """
-    
-    # Add rows for each concentration/OD pair
-    for i, (conc, od) in enumerate(zip(concentrations, od_values)):
-        table += f'<tr><td>{conc}</td><td>{od}</td></tr>\n'
-    
-    table += '</table>'
-    return table
+    {rows}</table>"""
 
 def populate_enhanced_template(
     template_path: Path, 
@@ -126,8 +119,11 @@ def populate_enhanced_template(
         True if successful, False otherwise
     """
     try:
-        # Load the template with docxtpl
-        template = DocxTemplate(str(template_path))
+        # Load the template with docxtpl; the file is read from disk once per
+        # modification and every render parses its own copy of the bytes
+        template_path = Path(template_path)
+        template_bytes = load_template_bytes(str(template_path), template_path.stat().st_mtime)
+        template = DocxTemplate(BytesIO(template_bytes))
         
         # Create a context dictionary for template rendering
         context = {}
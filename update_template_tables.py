@@ -6,6 +6,7 @@ and reproducibility section.
 
 import logging
 import sys
+from io import BytesIO
 from docx import Document
 import re
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -226,50 +227,23 @@ def update_enhanced_template():
         reprod_table.style = 'Table Grid'
         reprod_table.alignment = WD_TABLE_ALIGNMENT.CENTER
         
-        # Fill header row
-        header_cells = ["", "Lot 1", "Lot 2", "Lot 3", "Lot 4", "Mean", "CV (%)"]
-        for i, text in enumerate(header_cells):
-            reprod_table.cell(0, i).text = text
-            for paragraph in reprod_table.cell(0, i).paragraphs:
-                for run in paragraph.runs:
-                    run.bold = True
-                paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        # Header row followed by placeholder values for the data rows
+        reprod_rows = [["", "Lot 1", "Lot 2", "Lot 3", "Lot 4", "Mean", "CV (%)"]]
+        for n in range(1, 4):
+            reprod_rows.append([f"Sample {n}"] + [f"{{{{ repro_sample{n}_{field} }}}}"
+                                                  for field in ("lot1", "lot2", "lot3", "lot4", "mean", "cv")])
         
-        # Add placeholder values for data rows
-        reprod_table.cell(1, 0).text = "Sample 1"
-        reprod_table.cell(1, 1).text = "{{ repro_sample1_lot1 }}"
-        reprod_table.cell(1, 2).text = "{{ repro_sample1_lot2 }}"
-        reprod_table.cell(1, 3).text = "{{ repro_sample1_lot3 }}"
-        reprod_table.cell(1, 4).text = "{{ repro_sample1_lot4 }}"
-        reprod_table.cell(1, 5).text = "{{ repro_sample1_mean }}"
-        reprod_table.cell(1, 6).text = "{{ repro_sample1_cv }}"
-        
-        reprod_table.cell(2, 0).text = "Sample 2"
-        reprod_table.cell(2, 1).text = "{{ repro_sample2_lot1 }}"
-        reprod_table.cell(2, 2).text = "{{ repro_sample2_lot2 }}"
-        reprod_table.cell(2, 3).text = "{{ repro_sample2_lot3 }}"
-        reprod_table.cell(2, 4).text = "{{ repro_sample2_lot4 }}"
-        reprod_table.cell(2, 5).text = "{{ repro_sample2_mean }}"
-        reprod_table.cell(2, 6).text = "{{ repro_sample2_cv }}"
-        
-        reprod_table.cell(3, 0).text = "Sample 3"
-        reprod_table.cell(3, 1).text = "{{ repro_sample3_lot1 }}"
-        reprod_table.cell(3, 2).text = "{{ repro_sample3_lot2 }}"
-        reprod_table.cell(3, 3).text = "{{ repro_sample3_lot3 }}"
-        reprod_table.cell(3, 4).text = "{{ repro_sample3_lot4 }}"
-        reprod_table.cell(3, 5).text = "{{ repro_sample3_mean }}"
-        reprod_table.cell(3, 6).text = "{{ repro_sample3_cv }}"
-        
-        # Bold the first column
-        for i in range(1, 4):
-            for paragraph in reprod_table.cell(i, 0).paragraphs:
-                for run in paragraph.runs:
-                    run.bold = True
-        
-        # Center all cell contents
-        for row in reprod_table.rows:
-            for cell in row.cells:
+        # Fill the table row by row, reading each row's cells once rather than
+        # rebuilding the whole cell grid for every table.cell() call
+        for row_idx, (row, values) in enumerate(zip(reprod_table.rows, reprod_rows)):
+            for col_idx, (cell, text) in enumerate(zip(row.cells, values)):
+                cell.text = text
                 for paragraph in cell.paragraphs:
+                    # Bold the header row and the first column
+                    if row_idx == 0 or col_idx == 0:
+                        for run in paragraph.runs:
+                            run.bold = True
+                    # Center all cell contents
                     paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
         
         section_updated = True
@@ -347,13 +321,15 @@ def update_enhanced_template():
                             
                             break
     
-    # Save the updated document
-    doc.save(output_path)
+    # Serialize the updated document once and write the same bytes to both paths
+    buffer = BytesIO()
+    doc.save(buffer)
+    data = buffer.getvalue()
+    output_path.write_bytes(data)
     logger.info(f"Updated template saved to {output_path}")
     
     # Overwrite the original template
-    import shutil
-    shutil.copy(output_path, template_path)
+    template_path.write_bytes(data)
     logger.info(f"Updated original template at {template_path}")
     
     return section_updated or curve_table_updated
@@ -2,8 +2,13 @@
 Utility functions for ELISA datasheet processing.
 """
 
+import bisect
+import functools
+import os
 import re
+import shutil
 import logging
+from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 
 def clean_text(text: str) -> str:
@@ -148,3 +153,132 @@ def convert_units(value: str, from_unit: str, to_unit: str) -> str:
     else:
         logger.warning(f"No conversion defined for {from_unit} to {to_unit}")
         return value
+
+@functools.lru_cache(maxsize=8)
+def load_template_bytes(path: str, mtime: float) -> bytes:
+    """
+    Read a template file, memoised per path and modification time.
+    
+    Populators created repeatedly in one process (batch runs, test
+    sessions) share the bytes, and an edited template is re-read because
+    its mtime changes.
+    
+    Args:
+        path: Path to the template file
+        mtime: Modification time of the file, part of the cache key
+        
+    Returns:
+        The raw bytes of the template
+    """
+    return Path(path).read_bytes()
+
+def create_backup(path: Union[str, Path], backup_path: Union[str, Path]) -> None:
+    """
+    Back up a file as a hard link to it, falling back to a copy.
+    
+    The link shares the file's data instead of duplicating it, so the original
+    must then be rewritten with save_document_replacing (which writes a new file)
+    rather than truncated in place.
+    
+    Args:
+        path: The file to back up
+        backup_path: Where the backup should be created, replacing any earlier backup
+    """
+    try:
+        os.unlink(backup_path)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(path, backup_path)
+    except OSError:
+        shutil.copy2(path, backup_path)
+
+def save_document_replacing(doc: Any, path: Union[str, Path]) -> None:
+    """
+    Save a document to a temporary sibling file and move it over path.
+    
+    Args:
+        doc: The python-docx Document to save
+        path: The destination path
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    doc.save(tmp_path)
+    os.replace(tmp_path, path)
+
+# Company name replacements, applied in a single scan; the longer form is listed
+# first so 'Reddot Biotech INC.' is not split into 'Innovative Research INC.'
+COMPANY_NAME_REPLACEMENTS = {
+    'Reddot Biotech INC.': 'Innovative Research, Inc.',
+    'Reddot Biotech': 'Innovative Research',
+}
+_COMPANY_NAME_RE = re.compile('|'.join(re.escape(old) for old in COMPANY_NAME_REPLACEMENTS))
+
+def replace_company_names(text: str) -> str:
+    """
+    Replace every Reddot company name in text in one pass.
+    
+    Args:
+        text: The text to rewrite
+        
+    Returns:
+        The text with Innovative Research names
+    """
+    return _COMPANY_NAME_RE.sub(lambda m: COMPANY_NAME_REPLACEMENTS[m.group(0)], text)
+
+def replace_company_names_in_body(doc: Any) -> int:
+    """
+    Replace the Reddot company names throughout a document body, keeping run formatting.
+    
+    Names are matched in each paragraph's joined <w:t> text, in body paragraphs
+    and table cells alike, so a name split across runs (e.g. 'Reddot Biotech'
+    + ' INC.') is still seen whole. The replacement goes into the text node
+    where the name starts and the rest of the name is cut from the nodes it
+    spills into; every other run keeps its text and formatting.
+    
+    Args:
+        doc: The python-docx Document to modify
+        
+    Returns:
+        The number of company names replaced
+    """
+    from docx.oxml.ns import qn
+    
+    p_tag = qn('w:p')
+    replacements = 0
+    for p in doc.element.body.xpath('.//w:p[contains(., "Reddot Biotech")]'):
+        # Only this paragraph's own text nodes, not those of nested (text box) paragraphs
+        ts = [t for t in p.iter(qn('w:t')) if next(t.iterancestors(p_tag)) is p]
+        texts = [t.text or '' for t in ts]
+        matches = list(_COMPANY_NAME_RE.finditer(''.join(texts)))
+        if not matches:
+            continue
+        
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text)
+        
+        # Work from the last match back so earlier offsets stay valid
+        new_texts = list(texts)
+        for m in reversed(matches):
+            first = bisect.bisect_right(starts, m.start()) - 1
+            last = bisect.bisect_right(starts, m.end() - 1) - 1
+            head = new_texts[first][:m.start() - starts[first]] + COMPANY_NAME_REPLACEMENTS[m.group(0)]
+            if first == last:
+                new_texts[first] = head + new_texts[first][m.end() - starts[first]:]
+            else:
+                new_texts[first] = head
+                for j in range(first + 1, last):
+                    new_texts[j] = ''
+                new_texts[last] = new_texts[last][m.end() - starts[last]:]
+        
+        for t, old_text, new_text in zip(ts, texts, new_texts):
+            if new_text != old_text:
+                t.text = new_text
+                if new_text != new_text.strip():
+                    t.set(qn('xml:space'), 'preserve')
+        replacements += len(matches)
+    
+    return replacements